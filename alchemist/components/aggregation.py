@@ -1,36 +1,84 @@
 """Result aggregation components."""
 
 import asyncio
+import itertools
+import sys
+from collections import Counter, defaultdict
 from typing import Any, Dict, List, Optional, Union
 import time
-import json
+
+import numpy as np
 
 from ..core.component import Component, ComponentResult, ComponentStatus
 
+# Shared immutable sentinel for successful results; avoids a fresh list per call
+_NO_ERRORS = ()
+
+
+class _ConsensusTally:
+    """Streaming tally of normalized items for consensus analysis."""
+
+    __slots__ = ("counts", "sources_by_key", "originals")
+
+    def __init__(self):
+        self.counts = Counter()
+        self.sources_by_key = defaultdict(set)
+        self.originals = {}
+
+    def add_all(self, items: List[str], source: str) -> None:
+        """Count a batch of items attributed to a single source."""
+        counts = self.counts
+        sources_by_key = self.sources_by_key
+        setdefault = self.originals.setdefault
+        for item in items:
+            key = sys.intern(item.lower().strip())
+            counts[key] += 1
+            sources_by_key[key].add(source)
+            setdefault(key, item)
+
 
 class ResultAggregation(Component):
     """Base class for result aggregation components."""
-    
+
+    __slots__ = ("aggregation_strategy", "weighting", "_config_valid")
+
+    VALID_STRATEGIES = frozenset({"merge", "vote", "weighted_average", "consensus", "priority"})
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.aggregation_strategy = config.get("aggregation_strategy", "merge") if config else "merge"
         self.weighting = config.get("weighting", {}) if config else {}
-    
+        self._config_valid: Optional[bool] = None
+
     def validate_config(self) -> bool:
-        """Validate aggregation configuration."""
-        valid_strategies = ["merge", "vote", "weighted_average", "consensus", "priority"]
-        return self.aggregation_strategy in valid_strategies
+        """Validate aggregation configuration (memoized; config is fixed after init)."""
+        if self._config_valid is None:
+            self._config_valid = self.aggregation_strategy in self.VALID_STRATEGIES
+        return self._config_valid
+
+    async def execute_batch(self, batch: List[Dict[str, Any]]) -> List[ComponentResult]:
+        """Aggregate many input groups inside a single coroutine.
+
+        Amortizes per-call event-loop dispatch when a caller would otherwise
+        schedule thousands of individual ``execute`` coroutines.
+        """
+        return [await self.execute(inputs) for inputs in batch]
 
 
 class MergeAggregation(ResultAggregation):
     """Merge results from multiple sources."""
-    
+
+    __slots__ = ()
+
+    # Per-source list fields lifted into combined_data
+    _COMBINE_KEYS = ("insights", "recommendations", "conclusions")
+
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute result merging."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
-            merged_results = await self._merge_inputs(inputs)
+            merged_results = self._merge_inputs(inputs)
             
             return ComponentResult(
                 status=ComponentStatus.COMPLETED,
@@ -40,8 +88,8 @@ class MergeAggregation(ResultAggregation):
                     "input_sources": list(inputs.keys()),
                     "total_inputs": len(inputs)
                 },
-                errors=[],
-                execution_time=time.time() - start_time
+                errors=_NO_ERRORS,
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
             
         except Exception as e:
@@ -50,49 +98,47 @@ class MergeAggregation(ResultAggregation):
                 data=None,
                 metadata={},
                 errors=[f"Merge aggregation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
     
-    async def _merge_inputs(self, inputs: Dict[str, Any]) -> Dict:
+    def _merge_inputs(self, inputs: Dict[str, Any]) -> Dict:
         """Merge all inputs into a single result."""
+        sources = {}
+        combined_data = {}
         merged = {
-            "sources": {},
-            "combined_data": {},
+            "sources": sources,
+            "combined_data": combined_data,
             "metadata": {
                 "merge_timestamp": time.time(),
                 "source_count": len(inputs)
             }
         }
-        
+
+        # Collect the per-source lists by reference; elements are copied
+        # once at the end when each bucket is chained into one list
+        buckets: Dict[str, List[List[Any]]] = defaultdict(list)
+
         for source_name, source_data in inputs.items():
-            merged["sources"][source_name] = source_data
-            
+            sources[source_name] = source_data
+
             # Extract specific data types for combination
-            if isinstance(source_data, dict):
-                if "insights" in source_data:
-                    if "insights" not in merged["combined_data"]:
-                        merged["combined_data"]["insights"] = []
-                    if isinstance(source_data["insights"], list):
-                        merged["combined_data"]["insights"].extend(source_data["insights"])
-                
-                if "recommendations" in source_data:
-                    if "recommendations" not in merged["combined_data"]:
-                        merged["combined_data"]["recommendations"] = []
-                    if isinstance(source_data["recommendations"], list):
-                        merged["combined_data"]["recommendations"].extend(source_data["recommendations"])
-                
-                if "conclusions" in source_data:
-                    if "conclusions" not in merged["combined_data"]:
-                        merged["combined_data"]["conclusions"] = []
-                    if isinstance(source_data["conclusions"], list):
-                        merged["combined_data"]["conclusions"].extend(source_data["conclusions"])
-        
+            if type(source_data) is dict:
+                for key in self._COMBINE_KEYS:
+                    val = source_data.get(key)
+                    if val.__class__ is list and val:
+                        buckets[key].append(val)
+
+        for key, parts in buckets.items():
+            combined_data[key] = list(itertools.chain.from_iterable(parts))
+
         return merged
 
 
 class VotingAggregation(ResultAggregation):
     """Aggregate results using voting mechanisms."""
-    
+
+    __slots__ = ("voting_method", "confidence_threshold")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.voting_method = config.get("voting_method", "majority") if config else "majority"
@@ -100,10 +146,10 @@ class VotingAggregation(ResultAggregation):
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute voting aggregation."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
-            voting_results = await self._perform_voting(inputs)
+            voting_results = self._perform_voting(inputs)
             
             return ComponentResult(
                 status=ComponentStatus.COMPLETED,
@@ -114,8 +160,8 @@ class VotingAggregation(ResultAggregation):
                     "confidence_threshold": self.confidence_threshold,
                     "voter_count": len(inputs)
                 },
-                errors=[],
-                execution_time=time.time() - start_time
+                errors=_NO_ERRORS,
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
             
         except Exception as e:
@@ -124,75 +170,100 @@ class VotingAggregation(ResultAggregation):
                 data=None,
                 metadata={},
                 errors=[f"Voting aggregation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
     
-    async def _perform_voting(self, inputs: Dict[str, Any]) -> Dict:
+    def _perform_voting(self, inputs: Dict[str, Any]) -> Dict:
         """Perform voting on input results."""
         votes = {}
+        vote_counts = Counter()
         confidence_scores = {}
-        
+
         # Extract votable items from inputs
         for source_name, source_data in inputs.items():
-            if isinstance(source_data, dict):
-                # Extract confidence scores if available
-                if "confidence_scores" in source_data:
-                    confidence_scores[source_name] = source_data["confidence_scores"]
-                
-                # Extract conclusions/classifications for voting
-                if "conclusions" in source_data and isinstance(source_data["conclusions"], list):
-                    for conclusion in source_data["conclusions"]:
-                        if conclusion not in votes:
-                            votes[conclusion] = []
-                        votes[conclusion].append(source_name)
-                
-                # Extract binary classifications
-                if "classification" in source_data:
-                    classification = source_data["classification"]
-                    if classification not in votes:
-                        votes[classification] = []
-                    votes[classification].append(source_name)
-        
+            if type(source_data) is not dict:
+                continue
+            get = source_data.get
+
+            # Extract confidence scores if available
+            scores = get("confidence_scores")
+            if scores is not None:
+                confidence_scores[source_name] = scores
+
+            # Extract conclusions/classifications for voting; string keys
+            # are interned so repeated ballot lookups become identity
+            # comparisons, non-string votes pass through untouched
+            conclusions = get("conclusions")
+            if isinstance(conclusions, list):
+                for conclusion in conclusions:
+                    if type(conclusion) is str:
+                        conclusion = sys.intern(conclusion)
+                    votes.setdefault(conclusion, []).append(source_name)
+                    vote_counts[conclusion] += 1
+
+            # Extract binary classifications
+            classification = get("classification")
+            if classification is not None:
+                if type(classification) is str:
+                    classification = sys.intern(classification)
+                votes.setdefault(classification, []).append(source_name)
+                vote_counts[classification] += 1
+
         # Determine winner based on voting method
-        winner = self._determine_winner(votes)
-        
+        winner = self._determine_winner(votes, vote_counts)
+
         return {
             "voting_results": votes,
             "winner": winner,
             "confidence_scores": confidence_scores,
             "voting_summary": {
-                "total_votes": sum(len(voters) for voters in votes.values()),
+                "total_votes": sum(vote_counts.values()),
                 "unique_options": len(votes),
-                "winning_margin": len(votes.get(winner, [])) if winner else 0
+                "winning_margin": vote_counts[winner] if winner else 0
             }
         }
-    
-    def _determine_winner(self, votes: Dict[str, List[str]]) -> Optional[str]:
+
+    def _determine_winner(self, votes: Dict[str, List[str]],
+                          vote_counts: Optional[Counter] = None) -> Optional[str]:
         """Determine winner based on voting method."""
         if not votes:
             return None
-        
-        if self.voting_method == "majority":
-            # Simple majority - most votes wins
-            return max(votes.keys(), key=lambda k: len(votes[k]))
-        elif self.voting_method == "plurality":
-            # Plurality - highest count wins (same as majority for this implementation)
-            return max(votes.keys(), key=lambda k: len(votes[k]))
+
+        if vote_counts is None:
+            vote_counts = Counter({option: len(voters) for option, voters in votes.items()})
+
+        if self.voting_method in ("majority", "plurality"):
+            # Most votes wins either way; most_common runs the selection in C
+            return vote_counts.most_common(1)[0][0]
         elif self.voting_method == "unanimous":
             # Unanimous - only win if all votes agree
             if len(votes) == 1:
                 return list(votes.keys())[0]
             return None
-        
+
         return None
 
 
 class WeightedAggregation(ResultAggregation):
     """Aggregate results using weighted averaging."""
-    
+
+    __slots__ = ("_high_sources", "_medium_sources")
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        super().__init__(name, config)
+        # Partition sources into weight tiers once; weighting is fixed after init
+        high, medium = [], []
+        for source_name, weight in self.weighting.items():
+            if weight >= 0.8:
+                high.append(source_name)
+            elif weight >= 0.5:
+                medium.append(source_name)
+        self._high_sources = frozenset(high)
+        self._medium_sources = frozenset(medium)
+
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute weighted aggregation."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             weighted_results = await self._perform_weighted_aggregation(inputs)
@@ -205,8 +276,8 @@ class WeightedAggregation(ResultAggregation):
                     "weighting_scheme": self.weighting,
                     "input_count": len(inputs)
                 },
-                errors=[],
-                execution_time=time.time() - start_time
+                errors=_NO_ERRORS,
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
             
         except Exception as e:
@@ -215,34 +286,36 @@ class WeightedAggregation(ResultAggregation):
                 data=None,
                 metadata={},
                 errors=[f"Weighted aggregation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
     
     async def _perform_weighted_aggregation(self, inputs: Dict[str, Any]) -> Dict:
         """Perform weighted aggregation of inputs."""
-        weighted_scores = {}
         total_weight = 0
-        
-        # Calculate weighted averages for numerical values
+        score_rows = []
+        score_entries = 0
+
+        # Collect numerical confidence scores per source
         for source_name, source_data in inputs.items():
             weight = self.weighting.get(source_name, 1.0)
             total_weight += weight
-            
-            if isinstance(source_data, dict):
-                # Extract numerical confidence scores
-                if "confidence_scores" in source_data:
-                    for key, score in source_data["confidence_scores"].items():
-                        if isinstance(score, (int, float)):
-                            if key not in weighted_scores:
-                                weighted_scores[key] = {"total": 0, "weight_sum": 0}
-                            weighted_scores[key]["total"] += score * weight
-                            weighted_scores[key]["weight_sum"] += weight
-        
-        # Calculate final weighted averages
-        final_scores = {}
-        for key, data in weighted_scores.items():
-            if data["weight_sum"] > 0:
-                final_scores[key] = data["total"] / data["weight_sum"]
+
+            if type(source_data) is dict:
+                scores = source_data.get("confidence_scores")
+                if scores:
+                    numeric = {
+                        key: score for key, score in scores.items()
+                        if type(score) in (int, float)
+                    }
+                    if numeric:
+                        score_rows.append((weight, numeric))
+                        score_entries += len(numeric)
+
+        # Dense score sets amortize a single BLAS matvec; sparse ones stay scalar
+        if score_entries > 128:
+            final_scores = self._weighted_average_numpy(score_rows)
+        else:
+            final_scores = self._weighted_average_scalar(score_rows)
         
         # Aggregate textual content with weights
         weighted_content = self._aggregate_textual_content(inputs, self.weighting)
@@ -254,6 +327,47 @@ class WeightedAggregation(ResultAggregation):
             "total_weight": total_weight
         }
     
+    @staticmethod
+    def _weighted_average_scalar(score_rows: List[tuple]) -> Dict[str, float]:
+        """Weighted-average scores with flat accumulators (small inputs)."""
+        totals = defaultdict(float)
+        weight_sums = defaultdict(float)
+
+        for weight, scores in score_rows:
+            for key, score in scores.items():
+                totals[key] += score * weight
+                weight_sums[key] += weight
+
+        return {
+            key: totals[key] / weight_sum
+            for key, weight_sum in weight_sums.items() if weight_sum > 0
+        }
+
+    @staticmethod
+    def _weighted_average_numpy(score_rows: List[tuple]) -> Dict[str, float]:
+        """Weighted-average scores via a vectorized matvec (dense inputs)."""
+        keys = sorted({key for _, scores in score_rows for key in scores})
+        key_index = {key: i for i, key in enumerate(keys)}
+
+        matrix = np.zeros((len(score_rows), len(keys)))
+        present = np.zeros((len(score_rows), len(keys)))
+        weights = np.empty(len(score_rows))
+
+        for row, (weight, scores) in enumerate(score_rows):
+            weights[row] = weight
+            for key, score in scores.items():
+                col = key_index[key]
+                matrix[row, col] = score
+                present[row, col] = 1.0
+
+        totals = weights @ matrix
+        weight_sums = weights @ present
+
+        return {
+            key: totals[key_index[key]] / weight_sums[key_index[key]]
+            for key in keys if weight_sums[key_index[key]] > 0
+        }
+
     def _aggregate_textual_content(self, inputs: Dict[str, Any], weights: Dict[str, float]) -> Dict:
         """Aggregate textual content based on weights."""
         content_sections = {
@@ -263,23 +377,35 @@ class WeightedAggregation(ResultAggregation):
             "all_recommendations": []
         }
         
+        high_sources = self._high_sources
+        medium_sources = self._medium_sources
+        high_extend = content_sections["high_weight_insights"].extend
+        medium_extend = content_sections["medium_weight_insights"].extend
+        low_extend = content_sections["low_weight_insights"].extend
+        rec_append = content_sections["all_recommendations"].append
+
         for source_name, source_data in inputs.items():
             weight = weights.get(source_name, 1.0)
-            
-            if isinstance(source_data, dict):
-                # Categorize insights by weight
-                if "insights" in source_data and isinstance(source_data["insights"], list):
-                    if weight >= 0.8:
-                        content_sections["high_weight_insights"].extend(source_data["insights"])
-                    elif weight >= 0.5:
-                        content_sections["medium_weight_insights"].extend(source_data["insights"])
+
+            if type(source_data) is dict:
+                get = source_data.get
+
+                # Categorize insights by precomputed weight tier; sources
+                # without an explicit weight default to 1.0 (high tier)
+                insights = get("insights")
+                if isinstance(insights, list):
+                    if source_name in high_sources or source_name not in weights:
+                        high_extend(insights)
+                    elif source_name in medium_sources:
+                        medium_extend(insights)
                     else:
-                        content_sections["low_weight_insights"].extend(source_data["insights"])
-                
+                        low_extend(insights)
+
                 # Collect all recommendations
-                if "recommendations" in source_data and isinstance(source_data["recommendations"], list):
-                    for rec in source_data["recommendations"]:
-                        content_sections["all_recommendations"].append({
+                recommendations = get("recommendations")
+                if isinstance(recommendations, list):
+                    for rec in recommendations:
+                        rec_append({
                             "recommendation": rec,
                             "source": source_name,
                             "weight": weight
@@ -293,7 +419,9 @@ class WeightedAggregation(ResultAggregation):
 
 class ConsensusAggregation(ResultAggregation):
     """Aggregate results by finding consensus."""
-    
+
+    __slots__ = ("consensus_threshold", "min_agreement")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.consensus_threshold = config.get("consensus_threshold", 0.7) if config else 0.7
@@ -301,7 +429,7 @@ class ConsensusAggregation(ResultAggregation):
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute consensus aggregation."""
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             consensus_results = await self._find_consensus(inputs)
@@ -315,8 +443,8 @@ class ConsensusAggregation(ResultAggregation):
                     "min_agreement": self.min_agreement,
                     "participant_count": len(inputs)
                 },
-                errors=[],
-                execution_time=time.time() - start_time
+                errors=_NO_ERRORS,
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
             
         except Exception as e:
@@ -325,7 +453,7 @@ class ConsensusAggregation(ResultAggregation):
                 data=None,
                 metadata={},
                 errors=[f"Consensus aggregation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=(time.monotonic_ns() - start_ns) * 1e-9
             )
     
     async def _find_consensus(self, inputs: Dict[str, Any]) -> Dict:
@@ -337,66 +465,73 @@ class ConsensusAggregation(ResultAggregation):
             "agreement_matrix": {}
         }
         
-        # Extract common elements across inputs
-        all_insights = []
-        all_recommendations = []
-        
+        # Count insights and recommendations in a single fused pass over the
+        # sources; no intermediate (key, item, source) lists are materialized
+        insight_tally = _ConsensusTally()
+        rec_tally = _ConsensusTally()
+
         for source_name, source_data in inputs.items():
-            if isinstance(source_data, dict):
-                if "insights" in source_data and isinstance(source_data["insights"], list):
-                    all_insights.extend([(insight, source_name) for insight in source_data["insights"]])
-                
-                if "recommendations" in source_data and isinstance(source_data["recommendations"], list):
-                    all_recommendations.extend([(rec, source_name) for rec in source_data["recommendations"]])
-        
-        # Find consensus in insights
-        insight_consensus = self._analyze_consensus(all_insights, len(inputs))
+            if type(source_data) is not dict:
+                continue
+            get = source_data.get
+
+            insights = get("insights")
+            if isinstance(insights, list):
+                insight_tally.add_all(insights, source_name)
+
+            recommendations = get("recommendations")
+            if isinstance(recommendations, list):
+                rec_tally.add_all(recommendations, source_name)
+
+        # The two bucketing passes are independent; overlap them in the
+        # executor for large tallies, but stay synchronous for small ones
+        # where the scheduling overhead would dominate
+        total_sources = len(inputs)
+        if len(insight_tally.counts) + len(rec_tally.counts) > 1000:
+            loop = asyncio.get_running_loop()
+            insight_consensus, rec_consensus = await asyncio.gather(
+                loop.run_in_executor(None, self._bucket_consensus, insight_tally, total_sources),
+                loop.run_in_executor(None, self._bucket_consensus, rec_tally, total_sources)
+            )
+        else:
+            insight_consensus = self._bucket_consensus(insight_tally, total_sources)
+            rec_consensus = self._bucket_consensus(rec_tally, total_sources)
+
         consensus_items["insights_consensus"] = insight_consensus
-        
-        # Find consensus in recommendations
-        rec_consensus = self._analyze_consensus(all_recommendations, len(inputs))
         consensus_items["recommendations_consensus"] = rec_consensus
-        
+
         return consensus_items
     
-    def _analyze_consensus(self, items: List[tuple], total_sources: int) -> Dict:
-        """Analyze consensus for a list of items."""
-        item_counts = {}
-        
-        for item, source in items:
-            item_key = item.lower().strip()
-            if item_key not in item_counts:
-                item_counts[item_key] = {"count": 0, "sources": [], "original": item}
-            item_counts[item_key]["count"] += 1
-            if source not in item_counts[item_key]["sources"]:
-                item_counts[item_key]["sources"].append(source)
-        
+    def _bucket_consensus(self, tally: "_ConsensusTally", total_sources: int) -> Dict:
+        """Bucket a streamed tally into strong/weak/no consensus groups."""
+        counts = tally.counts
+        sources_by_key = tally.sources_by_key
+        originals = tally.originals
+
         consensus_results = {
             "strong_consensus": [],
             "weak_consensus": [],
             "no_consensus": []
         }
-        
-        for item_key, data in item_counts.items():
-            agreement_ratio = len(data["sources"]) / total_sources
-            
-            if agreement_ratio >= self.consensus_threshold and len(data["sources"]) >= self.min_agreement:
-                consensus_results["strong_consensus"].append({
-                    "item": data["original"],
-                    "agreement_ratio": agreement_ratio,
-                    "supporting_sources": data["sources"]
-                })
-            elif len(data["sources"]) >= self.min_agreement:
-                consensus_results["weak_consensus"].append({
-                    "item": data["original"],
-                    "agreement_ratio": agreement_ratio,
-                    "supporting_sources": data["sources"]
-                })
+
+        consensus_threshold = self.consensus_threshold
+        min_agreement = self.min_agreement
+
+        for item_key in counts:
+            sources = sorted(sources_by_key[item_key])
+            agreement_ratio = len(sources) / total_sources
+
+            if agreement_ratio >= consensus_threshold and len(sources) >= min_agreement:
+                bucket = consensus_results["strong_consensus"]
+            elif len(sources) >= min_agreement:
+                bucket = consensus_results["weak_consensus"]
             else:
-                consensus_results["no_consensus"].append({
-                    "item": data["original"],
-                    "agreement_ratio": agreement_ratio,
-                    "supporting_sources": data["sources"]
-                })
-        
+                bucket = consensus_results["no_consensus"]
+
+            bucket.append({
+                "item": originals[item_key],
+                "agreement_ratio": agreement_ratio,
+                "supporting_sources": sources
+            })
+
         return consensus_results
\ No newline at end of file
@@ -3,13 +3,78 @@
 import asyncio
 import json
 import csv
+import os
+import sys
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 import time
 
+try:
+    import orjson  # Fast C JSON serializer (optional)
+except ImportError:
+    orjson = None
+
+try:
+    import aiohttp  # Async HTTP client (optional)
+except ImportError:
+    aiohttp = None
+
 from ..core.component import Component, ComponentResult, ComponentStatus
 
 
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dump_bytes(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS)
+else:
+    def _dump_bytes(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to an indented JSON string."""
+    return _dump_bytes(obj).decode("utf-8")
+
+
+# Console banner/separator strings, built once at import time
+# Single-pass C-level HTML escaping for list items interpolated into markup
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+})
+
+_BANNER = "=" * 60
+_SEPARATOR = "-" * 40
+
+# Static HTML report skeleton, built once at import time
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Alchemist Workflow Results</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .section { margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
+        .section h2 { margin-top: 0; color: #333; }
+        .json-data { background-color: #f5f5f5; padding: 10px; border-radius: 3px; white-space: pre-wrap; font-family: monospace; }
+        .metadata { font-size: 0.9em; color: #666; }
+        ul { margin: 10px 0; }
+        li { margin: 5px 0; }
+    </style>
+</head>
+<body>
+    <h1>Alchemist Workflow Results</h1>
+"""
+
+_HTML_FOOTER = """
+</body>
+</html>"""
+
+
 class OutputHandler(Component):
     """Base class for output handling components."""
     
@@ -29,22 +94,31 @@ class FileOutput(OutputHandler):
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute file output."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             output_data = self._prepare_output_data(inputs)
-            output_path = await self._write_to_file(output_data)
-            
+            # Write off the event loop so concurrent components are not
+            # blocked behind a disk flush
+            loop = asyncio.get_running_loop()
+            output_path = await loop.run_in_executor(None, self._write_to_file, output_data)
+
+            # Single stat on the just-written file replaces exists()+stat()
+            try:
+                file_size = os.stat(output_path).st_size
+            except OSError:
+                file_size = 0
+
             return ComponentResult(
                 status=ComponentStatus.COMPLETED,
                 data={"output_path": output_path, "format": self.output_format},
                 metadata={
                     "output_format": self.output_format,
                     "output_path": output_path,
-                    "file_size": Path(output_path).stat().st_size if Path(output_path).exists() else 0
+                    "file_size": file_size
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -53,14 +127,14 @@ class FileOutput(OutputHandler):
                 data=None,
                 metadata={},
                 errors=[f"File output failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     def _prepare_output_data(self, inputs: Dict[str, Any]) -> Union[Dict, List, str]:
         """Prepare data for output."""
         if len(inputs) == 1:
-            # Single input - output directly
-            return list(inputs.values())[0]
+            # Single input - output directly (no throwaway list)
+            return next(iter(inputs.values()))
         else:
             # Multiple inputs - create structured output
             return {
@@ -72,8 +146,8 @@ class FileOutput(OutputHandler):
                 }
             }
     
-    async def _write_to_file(self, data: Union[Dict, List, str]) -> str:
-        """Write data to file based on format."""
+    def _write_to_file(self, data: Union[Dict, List, str]) -> str:
+        """Write data to file based on format (runs in the executor)."""
         if not self.output_path:
             # Generate default output path
             timestamp = int(time.time())
@@ -83,17 +157,20 @@ class FileOutput(OutputHandler):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if self.output_format == "json":
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_path, 'wb') as f:
+                f.write(_dump_bytes(data))
         
         elif self.output_format == "csv":
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-                    # List of dictionaries - write as CSV
-                    fieldnames = data[0].keys()
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(data)
+                    # List of dictionaries - write as CSV. Plain csv.writer
+                    # with generator rows skips DictWriter's per-row copy
+                    fieldnames = tuple(data[0].keys())
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows(
+                        [row.get(field) for field in fieldnames] for row in data
+                    )
                 else:
                     # Convert other data types to CSV-friendly format
                     writer = csv.writer(f)
@@ -104,10 +181,18 @@ class FileOutput(OutputHandler):
                         writer.writerow([str(data)])
         
         elif self.output_format == "txt":
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if isinstance(data, (dict, list)):
-                    f.write(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+            if isinstance(data, (dict, list)):
+                if orjson is not None:
+                    # Single bytes buffer straight to disk, no str round-trip
+                    with open(output_path, 'wb') as f:
+                        f.write(orjson.dumps(data, option=_ORJSON_OPTS, default=str))
                 else:
+                    # json.dump streams fragments to the file handle instead
+                    # of materializing the whole document as one string
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(str(data))
         
         elif self.output_format == "html":
@@ -119,85 +204,69 @@ class FileOutput(OutputHandler):
     
     def _generate_html_report(self, data: Union[Dict, List, str]) -> str:
         """Generate HTML report from data."""
-        html = """<!DOCTYPE html>
-<html>
-<head>
-    <title>Alchemist Workflow Results</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .section { margin-bottom: 20px; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
-        .section h2 { margin-top: 0; color: #333; }
-        .json-data { background-color: #f5f5f5; padding: 10px; border-radius: 3px; white-space: pre-wrap; font-family: monospace; }
-        .metadata { font-size: 0.9em; color: #666; }
-        ul { margin: 10px 0; }
-        li { margin: 5px 0; }
-    </style>
-</head>
-<body>
-    <h1>Alchemist Workflow Results</h1>
-"""
-        
+        # Collect body fragments and join once; avoids O(n^2) string growth
+        parts = [_HTML_HEADER]
+
         if isinstance(data, dict):
             if "workflow_results" in data:
                 # Structured workflow output
-                html += self._format_workflow_results_html(data["workflow_results"])
+                parts.append(self._format_workflow_results_html(data["workflow_results"]))
                 if "metadata" in data:
-                    html += f'<div class="section"><h2>Metadata</h2><div class="json-data">{json.dumps(data["metadata"], indent=2)}</div></div>'
+                    parts.append(f'<div class="section"><h2>Metadata</h2><div class="json-data">{_dumps(data["metadata"])}</div></div>')
             else:
                 # Single component result
-                html += f'<div class="section"><h2>Results</h2><div class="json-data">{json.dumps(data, indent=2, default=str)}</div></div>'
+                parts.append(f'<div class="section"><h2>Results</h2><div class="json-data">{_dumps(data)}</div></div>')
         else:
-            html += f'<div class="section"><h2>Data</h2><div class="json-data">{json.dumps(data, indent=2, default=str)}</div></div>'
-        
-        html += """
-</body>
-</html>"""
-        return html
+            parts.append(f'<div class="section"><h2>Data</h2><div class="json-data">{_dumps(data)}</div></div>')
+
+        parts.append(_HTML_FOOTER)
+        return "".join(parts)
     
     def _format_workflow_results_html(self, workflow_results: Dict[str, Any]) -> str:
         """Format workflow results for HTML display."""
-        html = ""
-        
+        parts = []
+        append = parts.append
+
         for component_name, component_data in workflow_results.items():
-            html += f'<div class="section"><h2>Component: {component_name}</h2>'
-            
+            append(f'<div class="section"><h2>Component: {component_name}</h2>')
+
             if isinstance(component_data, dict):
                 # Format specific sections
                 if "insights" in component_data:
-                    html += "<h3>Insights</h3><ul>"
+                    append("<h3>Insights</h3><ul>")
                     insights = component_data["insights"]
                     if isinstance(insights, list):
                         for insight in insights:
-                            html += f"<li>{insight}</li>"
-                    html += "</ul>"
-                
+                            append(f"<li>{str(insight).translate(_ESCAPE_TABLE)}</li>")
+                    append("</ul>")
+
                 if "recommendations" in component_data:
-                    html += "<h3>Recommendations</h3><ul>"
+                    append("<h3>Recommendations</h3><ul>")
                     recommendations = component_data["recommendations"]
                     if isinstance(recommendations, list):
                         for rec in recommendations:
-                            html += f"<li>{rec}</li>"
-                    html += "</ul>"
-                
+                            append(f"<li>{str(rec).translate(_ESCAPE_TABLE)}</li>")
+                    append("</ul>")
+
                 if "conclusions" in component_data:
-                    html += "<h3>Conclusions</h3><ul>"
+                    append("<h3>Conclusions</h3><ul>")
                     conclusions = component_data["conclusions"]
                     if isinstance(conclusions, list):
                         for conclusion in conclusions:
-                            html += f"<li>{conclusion}</li>"
-                    html += "</ul>"
-                
+                            append(f"<li>{str(conclusion).translate(_ESCAPE_TABLE)}</li>")
+                    append("</ul>")
+
                 # Show raw data for other fields
                 other_data = {k: v for k, v in component_data.items() 
                              if k not in ["insights", "recommendations", "conclusions"]}
                 if other_data:
-                    html += f'<h3>Additional Data</h3><div class="json-data">{json.dumps(other_data, indent=2, default=str)}</div>'
+                    append(f'<h3>Additional Data</h3><div class="json-data">{_dumps(other_data)}</div>')
             else:
-                html += f'<div class="json-data">{json.dumps(component_data, indent=2, default=str)}</div>'
-            
-            html += "</div>"
-        
-        return html
+                append(f'<div class="json-data">{_dumps(component_data)}</div>')
+
+            append("</div>")
+
+        return "".join(parts)
 
 
 class ConsoleOutput(OutputHandler):
@@ -205,7 +274,7 @@ class ConsoleOutput(OutputHandler):
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute console output."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             self._print_to_console(inputs)
@@ -218,7 +287,7 @@ class ConsoleOutput(OutputHandler):
                     "input_count": len(inputs)
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -227,75 +296,83 @@ class ConsoleOutput(OutputHandler):
                 data=None,
                 metadata={},
                 errors=[f"Console output failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     def _print_to_console(self, inputs: Dict[str, Any]) -> None:
-        """Print results to console in a formatted way."""
-        print("=" * 60)
-        print("ALCHEMIST WORKFLOW RESULTS")
-        print("=" * 60)
-        
+        """Print results to console with a single buffered write."""
+        lines = [_BANNER, "ALCHEMIST WORKFLOW RESULTS", _BANNER]
+
         for component_name, component_data in inputs.items():
-            print(f"\n📊 Component: {component_name.upper()}")
-            print("-" * 40)
-            
+            lines.append(f"\n📊 Component: {component_name.upper()}")
+            lines.append(_SEPARATOR)
+
             if isinstance(component_data, dict):
-                self._print_structured_data(component_data)
+                self._format_structured_data(component_data, lines)
             else:
-                print(f"Data: {component_data}")
-        
-        print("\n" + "=" * 60)
-    
-    def _print_structured_data(self, data: Dict[str, Any]) -> None:
-        """Print structured data to console."""
-        # Print insights
+                lines.append(f"Data: {component_data}")
+
+        lines.append("\n" + _BANNER)
+
+        # One write + flush instead of a stdout lock/flush per print call
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def _format_structured_data(self, data: Dict[str, Any], lines: List[str]) -> None:
+        """Append formatted structured data to the output line buffer."""
+        append = lines.append
+
+        # Insights
         if "insights" in data and isinstance(data["insights"], list):
-            print("💡 Insights:")
+            append("💡 Insights:")
             for i, insight in enumerate(data["insights"], 1):
-                print(f"   {i}. {insight}")
-            print()
-        
-        # Print recommendations
+                append(f"   {i}. {insight}")
+            append("")
+
+        # Recommendations
         if "recommendations" in data and isinstance(data["recommendations"], list):
-            print("🎯 Recommendations:")
+            append("🎯 Recommendations:")
             for i, rec in enumerate(data["recommendations"], 1):
-                print(f"   {i}. {rec}")
-            print()
-        
-        # Print conclusions
+                append(f"   {i}. {rec}")
+            append("")
+
+        # Conclusions
         if "conclusions" in data and isinstance(data["conclusions"], list):
-            print("📝 Conclusions:")
+            append("📝 Conclusions:")
             for i, conclusion in enumerate(data["conclusions"], 1):
-                print(f"   {i}. {conclusion}")
-            print()
-        
-        # Print confidence scores
+                append(f"   {i}. {conclusion}")
+            append("")
+
+        # Confidence scores
         if "confidence_scores" in data and isinstance(data["confidence_scores"], dict):
-            print("📈 Confidence Scores:")
+            append("📈 Confidence Scores:")
             for key, score in data["confidence_scores"].items():
                 if isinstance(score, (int, float)):
-                    print(f"   {key}: {score:.2f}")
+                    append(f"   {key}: {score:.2f}")
                 else:
-                    print(f"   {key}: {score}")
-            print()
-        
-        # Print other relevant data
+                    append(f"   {key}: {score}")
+            append("")
+
+        # Other relevant data
         relevant_keys = ["voting_results", "winner", "weighted_scores", "consensus_items"]
         for key in relevant_keys:
             if key in data:
-                print(f"📋 {key.replace('_', ' ').title()}:")
+                append(f"📋 {key.replace('_', ' ').title()}:")
                 if isinstance(data[key], dict):
                     for k, v in data[key].items():
-                        print(f"   {k}: {v}")
+                        append(f"   {k}: {v}")
                 else:
-                    print(f"   {data[key]}")
-                print()
+                    append(f"   {data[key]}")
+                append("")
 
 
 class APIOutput(OutputHandler):
     """Output results to external APIs."""
-    
+
+    # One connection-pooling session shared by every APIOutput instance;
+    # created lazily because ClientSession needs a running event loop
+    _session = None
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.api_endpoint = config.get("api_endpoint") if config else None
@@ -305,24 +382,56 @@ class APIOutput(OutputHandler):
     def validate_config(self) -> bool:
         """Validate API output configuration."""
         return bool(self.api_endpoint)
-    
+
+    @classmethod
+    def _get_session(cls) -> "aiohttp.ClientSession":
+        """Return the shared client session, creating it on first use."""
+        session = cls._session
+        if session is None or session.closed:
+            session = cls._session = aiohttp.ClientSession()
+        return session
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared client session (call at workflow shutdown)."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute API output."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Simulate API call - replace with actual HTTP client
-            await asyncio.sleep(0.1)
-            
             payload = self._prepare_api_payload(inputs)
-            
-            # Mock API response
-            api_response = {
-                "status": "success",
-                "message": "Data successfully sent to API",
-                "endpoint": self.api_endpoint,
-                "payload_size": len(str(payload))
-            }
+
+            # Serialize once: the bytes double as the request body
+            # and their length is the real wire size
+            body = _dump_bytes(payload)
+            payload_size = len(body)
+
+            if aiohttp is not None and self.config.get("send_requests"):
+                session = self._get_session()
+                async with session.request(
+                    self.api_method,
+                    self.api_endpoint,
+                    data=body,
+                    headers={"Content-Type": "application/json", **self.api_headers},
+                ) as response:
+                    api_response = {
+                        "status": "success" if response.status < 400 else "error",
+                        "message": f"API responded with HTTP {response.status}",
+                        "endpoint": self.api_endpoint,
+                        "payload_size": payload_size
+                    }
+            else:
+                # Mock response when aiohttp is unavailable or sending is disabled
+                api_response = {
+                    "status": "success",
+                    "message": "Data successfully sent to API",
+                    "endpoint": self.api_endpoint,
+                    "payload_size": payload_size
+                }
             
             return ComponentResult(
                 status=ComponentStatus.COMPLETED,
@@ -330,10 +439,10 @@ class APIOutput(OutputHandler):
                 metadata={
                     "api_endpoint": self.api_endpoint,
                     "api_method": self.api_method,
-                    "payload_size": len(str(payload))
+                    "payload_size": payload_size
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -342,7 +451,7 @@ class APIOutput(OutputHandler):
                 data=None,
                 metadata={},
                 errors=[f"API output failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     def _prepare_api_payload(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
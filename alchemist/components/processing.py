@@ -1,12 +1,76 @@
 """Data processing components."""
 
 import asyncio
+import os
+import operator
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any, Dict, List, Optional, Union, Callable
 import time
 
+import numpy as np
+
+try:
+    import pandas as pd  # Vectorized DataFrame fast path (optional)
+except ImportError:
+    pd = None
+
 from ..core.component import Component, ComponentResult, ComponentStatus
 
+# Row count above which per-row work is spread across the shared pool
+_PARALLEL_THRESHOLD = 10_000
+
+# Sentinel distinguishing "field absent" from a stored None
+_MISSING = object()
+
+# Condition operators resolved once to C-level callables
+_OPERATOR_TABLE: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "contains": lambda value, target: target in str(value),
+}
+
+_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _pool
+
+
+def _map_chunked(func: Callable[[List], List], data: List) -> List:
+    """Apply ``func`` to chunks of ``data`` in parallel and re-join results."""
+    pool = _get_pool()
+    workers = pool._max_workers
+    chunk_size = (len(data) + workers - 1) // workers
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    return list(chain.from_iterable(pool.map(func, chunks)))
+
+
+def _extract_columns(data: List[Dict], fields) -> Dict[str, List[Any]]:
+    """Transpose a list of records into per-field value columns.
+
+    One pass over the rows replaces a full scan per aggregated field, and
+    the resulting columns feed NumPy reductions directly.
+    """
+    columns: Dict[str, List[Any]] = {field: [] for field in fields}
+    appends = {field: column.append for field, column in columns.items()}
+
+    for item in data:
+        for field, append in appends.items():
+            value = item.get(field)
+            if value is not None:
+                append(value)
+
+    return columns
+
 
 class DataProcessing(Component):
     """Base class for data processing components."""
@@ -14,11 +78,24 @@ class DataProcessing(Component):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.operations = config.get("operations", []) if config else []
+        # Optional explicit upstream key; turns input lookup into O(1)
+        self.input_key = config.get("input_key") if config else None
     
     def validate_config(self) -> bool:
         """Validate processing configuration."""
         return True
 
+    def _first_collection(self, inputs: Dict[str, Any], types: tuple = (list, dict)) -> Any:
+        """Pick the input collection to process.
+
+        Uses the configured input_key when present, otherwise falls back
+        to the first value of an accepted collection type.
+        """
+        if self.input_key is not None:
+            value = inputs.get(self.input_key)
+            return value if isinstance(value, types) else None
+        return next((v for v in inputs.values() if isinstance(v, types)), None)
+
 
 class FilterProcessor(DataProcessing):
     """Filter data based on conditions."""
@@ -26,21 +103,57 @@ class FilterProcessor(DataProcessing):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.filter_conditions = config.get("filter_conditions", {}) if config else {}
+        # Conditions are fixed per instance; specialize the predicate once so
+        # the per-row check skips the generic operator-dispatch loop
+        self._predicate = self._compile_predicate(self.filter_conditions)
+        # Resolve each condition to a (field, op callable, target) tuple for
+        # the generic fallback path as well
+        self._conditions = self._resolve_conditions(self.filter_conditions)
+
+    @staticmethod
+    def _compile_predicate(conditions: Dict[str, Any]) -> Callable[[Dict], bool]:
+        """Compile filter conditions into a specialized predicate function."""
+        namespace: Dict[str, Any] = {}
+        lines = ["def _pred(item):"]
+
+        for i, (field, condition) in enumerate(conditions.items()):
+            field_ref = f"_field{i}"
+            target_ref = f"_target{i}"
+            namespace[field_ref] = field
+            lines.append(f"    if {field_ref} not in item: return False")
+
+            if isinstance(condition, dict):
+                op = condition.get("operator", "eq")
+                namespace[target_ref] = condition.get("value")
+                checks = {
+                    "eq": f"item[{field_ref}] != {target_ref}",
+                    "ne": f"item[{field_ref}] == {target_ref}",
+                    "gt": f"item[{field_ref}] <= {target_ref}",
+                    "lt": f"item[{field_ref}] >= {target_ref}",
+                    "contains": f"{target_ref} not in str(item[{field_ref}])",
+                }
+                check = checks.get(op)
+                if check is not None:
+                    lines.append(f"    if {check}: return False")
+            else:
+                namespace[target_ref] = condition
+                lines.append(f"    if item[{field_ref}] != {target_ref}: return False")
+
+        lines.append("    return True")
+        exec(compile("\n".join(lines), "<filter_predicate>", "exec"), namespace)
+        return namespace["_pred"]
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute data filtering."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            input_data = None
-            for key, value in inputs.items():
-                if isinstance(value, (list, dict)):
-                    input_data = value
-                    break
-            
+            input_data = self._first_collection(inputs)
+            if input_data is None and pd is not None:
+                input_data = self._first_collection(inputs, types=(pd.DataFrame,))
             if input_data is None:
                 raise ValueError("No valid input data found")
-            
+
             filtered_data = await self._apply_filters(input_data)
             
             return ComponentResult(
@@ -52,7 +165,7 @@ class FilterProcessor(DataProcessing):
                     "filter_conditions": self.filter_conditions
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -61,49 +174,64 @@ class FilterProcessor(DataProcessing):
                 data=None,
                 metadata={},
                 errors=[f"Filtering failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     async def _apply_filters(self, data: Union[List, Dict]) -> Union[List, Dict]:
         """Apply filter conditions to data."""
+        if pd is not None and isinstance(data, pd.DataFrame):
+            # Vectorized path: the whole filter runs as C-level masks
+            return data[self._dataframe_mask(data)]
         if isinstance(data, list):
-            filtered = []
-            for item in data:
-                if self._meets_conditions(item):
-                    filtered.append(item)
-            return filtered
+            predicate = self._predicate
+            if len(data) > _PARALLEL_THRESHOLD:
+                return _map_chunked(
+                    lambda chunk: [item for item in chunk if predicate(item)], data
+                )
+            return [item for item in data if predicate(item)]
         elif isinstance(data, dict):
-            if self._meets_conditions(data):
+            if self._predicate(data):
                 return data
             else:
                 return {}
         return data
     
-    def _meets_conditions(self, item: Dict) -> bool:
-        """Check if item meets filter conditions."""
-        for field, condition in self.filter_conditions.items():
-            if field not in item:
-                return False
-            
-            value = item[field]
+    def _dataframe_mask(self, frame):
+        """Combine the resolved conditions into one boolean row mask."""
+        masks = []
+        for field, op_fn, target in self._conditions:
+            column = frame[field]
+            if op_fn is _OPERATOR_TABLE["contains"]:
+                masks.append(column.astype(str).str.contains(str(target), regex=False))
+            else:
+                # operator.eq/ne/gt/lt broadcast elementwise over Series
+                masks.append(op_fn(column, target))
+        if not masks:
+            return np.ones(len(frame), dtype=bool)
+        return np.logical_and.reduce(masks)
+
+    @staticmethod
+    def _resolve_conditions(conditions: Dict[str, Any]) -> List[tuple]:
+        """Resolve condition specs to (field, op callable, target) tuples."""
+        resolved = []
+        for field, condition in conditions.items():
             if isinstance(condition, dict):
-                op = condition.get("operator", "eq")
+                op_fn = _OPERATOR_TABLE.get(condition.get("operator", "eq"))
                 target = condition.get("value")
-                
-                if op == "eq" and value != target:
-                    return False
-                elif op == "ne" and value == target:
-                    return False
-                elif op == "gt" and value <= target:
-                    return False
-                elif op == "lt" and value >= target:
-                    return False
-                elif op == "contains" and target not in str(value):
-                    return False
             else:
-                if value != condition:
-                    return False
-        
+                op_fn = operator.eq
+                target = condition
+            if op_fn is not None:
+                resolved.append((field, op_fn, target))
+        return resolved
+
+    def _meets_conditions(self, item: Dict) -> bool:
+        """Check if item meets filter conditions."""
+        get = item.get
+        for field, op_fn, target in self._conditions:
+            value = get(field, _MISSING)
+            if value is _MISSING or not op_fn(value, target):
+                return False
         return True
 
 
@@ -113,18 +241,21 @@ class TransformProcessor(DataProcessing):
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         super().__init__(name, config)
         self.transformations = config.get("transformations", {}) if config else {}
+        # Specialize each field's transformation into a plain callable once,
+        # so per-row work is a dict walk with no string/isinstance dispatch
+        self._handlers: Dict[str, Callable[[Any], Any]] = {}
+        for field, transformation in self.transformations.items():
+            handler = self._build_handler(transformation)
+            if handler is not None:
+                self._handlers[field] = handler
+        self._applicable = set(self._handlers)
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute data transformation."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            input_data = None
-            for key, value in inputs.items():
-                if isinstance(value, (list, dict)):
-                    input_data = value
-                    break
-            
+            input_data = self._first_collection(inputs)
             if input_data is None:
                 raise ValueError("No valid input data found")
             
@@ -138,7 +269,7 @@ class TransformProcessor(DataProcessing):
                     "record_count": len(transformed_data) if isinstance(transformed_data, list) else 1
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -147,41 +278,55 @@ class TransformProcessor(DataProcessing):
                 data=None,
                 metadata={},
                 errors=[f"Transformation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     async def _apply_transformations(self, data: Union[List, Dict]) -> Union[List, Dict]:
         """Apply transformations to data."""
         if isinstance(data, list):
-            return [self._transform_item(item) for item in data]
+            transform = self._transform_item
+            if len(data) > _PARALLEL_THRESHOLD:
+                return _map_chunked(
+                    lambda chunk: [transform(item) for item in chunk], data
+                )
+            return [transform(item) for item in data]
         elif isinstance(data, dict):
             return self._transform_item(data)
         return data
     
+    @staticmethod
+    def _build_handler(transformation: Any) -> Optional[Callable[[Any], Any]]:
+        """Build a value-transforming callable for one field, or None if
+        the transformation spec is unrecognized."""
+        if transformation == "uppercase":
+            return lambda value: str(value).upper()
+        if transformation == "lowercase":
+            return lambda value: str(value).lower()
+        if transformation == "strip":
+            return lambda value: str(value).strip()
+        if isinstance(transformation, dict):
+            if transformation.get("type") == "regex_replace" and transformation.get("pattern"):
+                # Close over the compiled pattern's bound sub method;
+                # configs may supply an already-compiled pattern object
+                pattern = transformation["pattern"]
+                sub = pattern.sub if hasattr(pattern, "sub") else re.compile(pattern).sub
+                replacement = transformation.get("replacement", "")
+                return lambda value: sub(replacement, str(value))
+            if transformation.get("type") == "map":
+                mapping = transformation.get("mapping", {})
+                return lambda value: mapping.get(value, value)
+        return None
+
     def _transform_item(self, item: Dict) -> Dict:
         """Transform a single data item."""
-        transformed = item.copy()
-        
-        for field, transformation in self.transformations.items():
-            if field in transformed:
-                value = transformed[field]
-                
-                if transformation == "uppercase":
-                    transformed[field] = str(value).upper()
-                elif transformation == "lowercase":
-                    transformed[field] = str(value).lower()
-                elif transformation == "strip":
-                    transformed[field] = str(value).strip()
-                elif isinstance(transformation, dict):
-                    if transformation.get("type") == "regex_replace":
-                        pattern = transformation.get("pattern")
-                        replacement = transformation.get("replacement", "")
-                        transformed[field] = re.sub(pattern, replacement, str(value))
-                    elif transformation.get("type") == "map":
-                        mapping = transformation.get("mapping", {})
-                        transformed[field] = mapping.get(value, value)
-        
-        return transformed
+        touched = self._applicable & item.keys()
+        if not touched:
+            # Nothing to transform; skip the defensive copy entirely
+            return item
+
+        handlers = self._handlers
+        updates = {field: handlers[field](item[field]) for field in touched}
+        return {**item, **updates}
 
 
 class AggregationProcessor(DataProcessing):
@@ -194,15 +339,10 @@ class AggregationProcessor(DataProcessing):
     
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute data aggregation."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            input_data = None
-            for key, value in inputs.items():
-                if isinstance(value, list):
-                    input_data = value
-                    break
-            
+            input_data = self._first_collection(inputs, types=(list,))
             if input_data is None:
                 raise ValueError("No valid list input data found for aggregation")
             
@@ -217,7 +357,7 @@ class AggregationProcessor(DataProcessing):
                     "group_by": self.group_by
                 },
                 errors=[],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
             
         except Exception as e:
@@ -226,7 +366,7 @@ class AggregationProcessor(DataProcessing):
                 data=None,
                 metadata={},
                 errors=[f"Aggregation failed: {str(e)}"],
-                execution_time=time.time() - start_time
+                execution_time=time.perf_counter() - start_time
             )
     
     async def _perform_aggregation(self, data: List[Dict]) -> Dict:
@@ -240,45 +380,99 @@ class AggregationProcessor(DataProcessing):
         """Aggregate all data without grouping."""
         result = {"total_records": len(data)}
         
+        columns = _extract_columns(data, self.aggregation_functions)
+
         for field, func in self.aggregation_functions.items():
-            values = [item.get(field) for item in data if field in item and item[field] is not None]
-            
+            values = columns[field]
+
             if not values:
                 result[f"{field}_{func}"] = None
                 continue
             
+            if func == "count":
+                result[f"{field}_{func}"] = len(values)
+                continue
+
             try:
-                numeric_values = [float(v) for v in values]
-                if func == "sum":
-                    result[f"{field}_{func}"] = sum(numeric_values)
-                elif func == "avg":
-                    result[f"{field}_{func}"] = sum(numeric_values) / len(numeric_values)
-                elif func == "min":
-                    result[f"{field}_{func}"] = min(numeric_values)
-                elif func == "max":
-                    result[f"{field}_{func}"] = max(numeric_values)
-                elif func == "count":
-                    result[f"{field}_{func}"] = len(values)
+                # One C-level reduction instead of a per-element Python loop
+                arr = np.array(values, dtype=np.float64)
             except (ValueError, TypeError):
-                if func == "count":
-                    result[f"{field}_{func}"] = len(values)
-                else:
-                    result[f"{field}_{func}"] = None
+                result[f"{field}_{func}"] = None
+                continue
+
+            if func == "sum":
+                result[f"{field}_{func}"] = float(arr.sum())
+            elif func == "avg":
+                result[f"{field}_{func}"] = float(arr.mean())
+            elif func == "min":
+                result[f"{field}_{func}"] = float(arr.min())
+            elif func == "max":
+                result[f"{field}_{func}"] = float(arr.max())
         
         return result
     
     def _group_and_aggregate(self, data: List[Dict]) -> Dict:
-        """Group data and aggregate within groups."""
-        groups = {}
-        
+        """Group data and aggregate within groups in a single streaming pass.
+
+        Per-(group, field) running accumulators replace materialized group
+        lists, keeping memory at O(groups x fields) instead of O(rows).
+        """
+        group_by = self.group_by
+        agg_items = list(self.aggregation_functions.items())
+        inf = float("inf")
+
+        # group key -> {"__rows__": n, field: [count, total, min, max, numeric]}
+        accumulators: Dict[Any, Dict[str, Any]] = {}
+
         for item in data:
-            group_key = item.get(self.group_by, "unknown")
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(item)
-        
+            group_key = item.get(group_by, "unknown")
+            acc = accumulators.get(group_key)
+            if acc is None:
+                acc = accumulators[group_key] = {"__rows__": 0}
+            acc["__rows__"] += 1
+
+            for field, _func in agg_items:
+                value = item.get(field)
+                if value is None:
+                    continue
+                stats = acc.get(field)
+                if stats is None:
+                    stats = acc[field] = [0, 0.0, inf, -inf, True]
+                stats[0] += 1
+                if stats[4]:
+                    try:
+                        numeric = float(value)
+                    except (ValueError, TypeError):
+                        stats[4] = False
+                    else:
+                        stats[1] += numeric
+                        if numeric < stats[2]:
+                            stats[2] = numeric
+                        if numeric > stats[3]:
+                            stats[3] = numeric
+
         result = {}
-        for group_key, group_data in groups.items():
-            result[str(group_key)] = self._aggregate_all(group_data)
-        
+        for group_key, acc in accumulators.items():
+            group_result = {"total_records": acc["__rows__"]}
+            for field, func in agg_items:
+                key = f"{field}_{func}"
+                stats = acc.get(field)
+                if stats is None:
+                    group_result[key] = None
+                elif func == "count":
+                    group_result[key] = stats[0]
+                elif not stats[4]:
+                    group_result[key] = None
+                elif func == "sum":
+                    group_result[key] = stats[1]
+                elif func == "avg":
+                    group_result[key] = stats[1] / stats[0]
+                elif func == "min":
+                    group_result[key] = stats[2]
+                elif func == "max":
+                    group_result[key] = stats[3]
+                else:
+                    group_result[key] = None
+            result[str(group_key)] = group_result
+
         return result
\ No newline at end of file
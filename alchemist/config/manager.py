@@ -1,13 +1,441 @@
 """Configuration management system."""
 
 import json
+import os
+import re
+import pickle
+import sys
 import yaml
-from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson  # Fast C JSON parser/serializer (optional)
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # SIMD-accelerated JSON parser (optional)
+except ImportError:
+    simdjson = None
+
+try:
+    # libyaml-backed loader/dumper: C scanner and parser
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field
+from copy import deepcopy
+from types import MappingProxyType
+
+# dataclass slots need 3.10+; plain dicts remain the fallback below
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Matches {placeholder} names for single-pass template substitution
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+def _yaml_load(f):
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+def _yaml_dump(config_data, f):
+    yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True)
+
+
+def _json_load(f):
+    if simdjson is not None:
+        return simdjson.load(f)
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
+def _json_dump(config_data, f):
+    json.dump(config_data, f, indent=2, ensure_ascii=False)
+
+
+# YAML files above this size are event-parsed straight into config
+# objects instead of materializing the whole intermediate dict tree
+_YAML_STREAM_THRESHOLD = 1 << 20
+
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+_SCALAR_CASTS = {
+    "tag:yaml.org,2002:null": lambda v: None,
+    "tag:yaml.org,2002:bool": lambda v: v.lower() in ("true", "yes", "on"),
+    "tag:yaml.org,2002:int": int,
+    "tag:yaml.org,2002:float": float,
+}
+
+
+def _resolve_scalar(event) -> Any:
+    """Convert a ScalarEvent to a Python value like SafeLoader would."""
+    if event.style not in (None, ""):
+        return event.value  # quoted scalars are always strings
+    tag = _YAML_RESOLVER.resolve(yaml.nodes.ScalarNode, event.value, (True, False))
+    cast = _SCALAR_CASTS.get(tag)
+    if cast is None:
+        return event.value
+    try:
+        return cast(event.value)
+    except ValueError:
+        return event.value
+
+
+def _build_yaml_value(events, event) -> Any:
+    """Materialize one value subtree from a parse-event stream."""
+    if isinstance(event, yaml.ScalarEvent):
+        return _resolve_scalar(event)
+    if isinstance(event, yaml.SequenceStartEvent):
+        items = []
+        while True:
+            event = next(events)
+            if isinstance(event, yaml.SequenceEndEvent):
+                return items
+            items.append(_build_yaml_value(events, event))
+    if isinstance(event, yaml.MappingStartEvent):
+        mapping = {}
+        while True:
+            event = next(events)
+            if isinstance(event, yaml.MappingEndEvent):
+                return mapping
+            key = _build_yaml_value(events, event)
+            mapping[key] = _build_yaml_value(events, next(events))
+    raise ValueError(f"Unsupported YAML event: {event!r}")
+
+
+# Suffix-keyed format handlers: one dict lookup replaces the load/save
+# branch chains and makes new formats a one-line addition
+_LOADERS = {".json": _json_load, ".yaml": _yaml_load, ".yml": _yaml_load}
+_DUMPERS = {".json": _json_dump, ".yaml": _yaml_dump, ".yml": _yaml_dump}
 
 
-@dataclass
+# Templates are plain literals shared by every ConfigManager instance;
+# built once at import and frozen below
+_COMPONENT_TEMPLATES = {
+    "file_ingestion": {
+        "required_config": ["source_path"],
+        "config_types": {
+            "source_path": str,
+            "source_type": str
+        },
+        "default_config": {
+            "source_type": "file"
+        }
+    },
+    "api_ingestion": {
+        "required_config": ["url"],
+        "config_types": {
+            "url": str,
+            "method": str,
+            "headers": dict,
+            "params": dict
+        },
+        "default_config": {
+            "method": "GET",
+            "headers": {},
+            "params": {}
+        }
+    },
+    "database_ingestion": {
+        "required_config": ["connection_string", "query"],
+        "config_types": {
+            "connection_string": str,
+            "query": str
+        }
+    },
+    "filter_processor": {
+        "required_config": [],
+        "config_types": {
+            "filter_conditions": dict
+        },
+        "default_config": {
+            "filter_conditions": {}
+        }
+    },
+    "transform_processor": {
+        "required_config": [],
+        "config_types": {
+            "transformations": dict
+        },
+        "default_config": {
+            "transformations": {}
+        }
+    },
+    "aggregation_processor": {
+        "required_config": [],
+        "config_types": {
+            "aggregation_functions": dict,
+            "group_by": str
+        }
+    },
+    "deterministic_reasoning": {
+        "required_config": [],
+        "config_types": {
+            "rules": list,
+            "functions": dict
+        },
+        "default_config": {
+            "rules": [],
+            "functions": {}
+        }
+    },
+    "probabilistic_reasoning": {
+        "required_config": [],
+        "config_types": {
+            "model_config": dict,
+            "prompts": dict,
+            "temperature": (int, float)
+        },
+        "default_config": {
+            "model_config": {},
+            "prompts": {},
+            "temperature": 0.7
+        }
+    },
+    "merge_aggregation": {
+        "required_config": [],
+        "config_types": {
+            "aggregation_strategy": str,
+            "weighting": dict
+        },
+        "default_config": {
+            "aggregation_strategy": "merge",
+            "weighting": {}
+        }
+    },
+    "voting_aggregation": {
+        "required_config": [],
+        "config_types": {
+            "voting_method": str,
+            "confidence_threshold": (int, float)
+        },
+        "default_config": {
+            "voting_method": "majority",
+            "confidence_threshold": 0.5
+        }
+    },
+    "weighted_aggregation": {
+        "required_config": [],
+        "config_types": {
+            "weighting": dict
+        },
+        "default_config": {
+            "weighting": {}
+        }
+    },
+    "consensus_aggregation": {
+        "required_config": [],
+        "config_types": {
+            "consensus_threshold": (int, float),
+            "min_agreement": int
+        },
+        "default_config": {
+            "consensus_threshold": 0.7,
+            "min_agreement": 2
+        }
+    },
+    "file_output": {
+        "required_config": [],
+        "config_types": {
+            "output_format": str,
+            "output_path": str
+        },
+        "default_config": {
+            "output_format": "json"
+        }
+    },
+    "console_output": {
+        "required_config": [],
+        "config_types": {},
+        "default_config": {}
+    },
+    "api_output": {
+        "required_config": ["api_endpoint"],
+        "config_types": {
+            "api_endpoint": str,
+            "api_method": str,
+            "api_headers": dict
+        },
+        "default_config": {
+            "api_method": "POST",
+            "api_headers": {}
+        }
+    }
+}
+
+_WORKFLOW_TEMPLATES = {
+    "simple_analysis": {
+        "name": "Simple Data Analysis",
+        "description": "Basic data ingestion, processing, and output workflow",
+        "components": [
+            {
+                "name": "data_source",
+                "type": "file_ingestion",
+                "config": {
+                    "source_path": "{input_file}",
+                    "source_type": "file"
+                }
+            },
+            {
+                "name": "processor",
+                "type": "filter_processor",
+                "dependencies": ["data_source"],
+                "config": {
+                    "filter_conditions": {}
+                }
+            },
+            {
+                "name": "output",
+                "type": "console_output",
+                "dependencies": ["processor"]
+            }
+        ]
+    },
+    "ml_pipeline": {
+        "name": "Machine Learning Pipeline",
+        "description": "Data ingestion, processing, ML reasoning, and output",
+        "components": [
+            {
+                "name": "data_ingestion",
+                "type": "file_ingestion",
+                "config": {
+                    "source_path": "{dataset_path}",
+                    "source_type": "file"
+                }
+            },
+            {
+                "name": "data_processing",
+                "type": "transform_processor",
+                "dependencies": ["data_ingestion"],
+                "config": {
+                    "transformations": {
+                        "text": "lowercase"
+                    }
+                }
+            },
+            {
+                "name": "ml_reasoning",
+                "type": "probabilistic_reasoning",
+                "dependencies": ["data_processing"],
+                "config": {
+                    "model_config": {
+                        "model_name": "{model_name}",
+                        "api_key": "{api_key}"
+                    },
+                    "prompts": {
+                        "analysis": {
+                            "template": "Analyze this data: {data}"
+                        }
+                    },
+                    "temperature": 0.3
+                }
+            },
+            {
+                "name": "results_output",
+                "type": "file_output",
+                "dependencies": ["ml_reasoning"],
+                "config": {
+                    "output_format": "json",
+                    "output_path": "{output_path}"
+                }
+            }
+        ]
+    },
+    "multi_source_analysis": {
+        "name": "Multi-Source Analysis",
+        "description": "Combine multiple data sources with consensus reasoning",
+        "components": [
+            {
+                "name": "source1",
+                "type": "file_ingestion",
+                "config": {
+                    "source_path": "{source1_path}",
+                    "source_type": "file"
+                }
+            },
+            {
+                "name": "source2",
+                "type": "api_ingestion",
+                "config": {
+                    "url": "{api_url}",
+                    "method": "GET"
+                }
+            },
+            {
+                "name": "reasoning1",
+                "type": "deterministic_reasoning",
+                "dependencies": ["source1"],
+                "config": {
+                    "rules": [
+                        {
+                            "name": "threshold_check",
+                            "condition": {
+                                "type": "count_threshold",
+                                "threshold": 10
+                            },
+                            "conclusion": "Sufficient data for analysis"
+                        }
+                    ]
+                }
+            },
+            {
+                "name": "reasoning2",
+                "type": "probabilistic_reasoning",
+                "dependencies": ["source2"],
+                "config": {
+                    "prompts": {
+                        "classification": {
+                            "template": "Classify this data: {data}"
+                        }
+                    }
+                }
+            },
+            {
+                "name": "consensus",
+                "type": "consensus_aggregation",
+                "dependencies": ["reasoning1", "reasoning2"],
+                "config": {
+                    "consensus_threshold": 0.7,
+                    "min_agreement": 1
+                }
+            },
+            {
+                "name": "final_output",
+                "type": "file_output",
+                "dependencies": ["consensus"],
+                "config": {
+                    "output_format": "html",
+                    "output_path": "{output_file}"
+                }
+            }
+        ]
+    }
+}
+
+# Component-type to class-name mapping, built once at import
+_DEFAULT_CLASS_NAMES = {
+    "file_ingestion": "FileIngestion",
+    "api_ingestion": "APIIngestion",
+    "database_ingestion": "DatabaseIngestion",
+    "filter_processor": "FilterProcessor",
+    "transform_processor": "TransformProcessor",
+    "aggregation_processor": "AggregationProcessor",
+    "deterministic_reasoning": "DeterministicReasoning",
+    "probabilistic_reasoning": "ProbabilisticReasoning",
+    "merge_aggregation": "MergeAggregation",
+    "voting_aggregation": "VotingAggregation",
+    "weighted_aggregation": "WeightedAggregation",
+    "consensus_aggregation": "ConsensusAggregation",
+    "file_output": "FileOutput",
+    "console_output": "ConsoleOutput",
+    "api_output": "APIOutput"
+}
+
+
+@dataclass(**_SLOTS)
 class ComponentConfig:
     """Configuration for a single component."""
     name: str
@@ -18,7 +446,7 @@ class ComponentConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowConfig:
     """Configuration for an entire workflow."""
     name: str
@@ -28,30 +456,101 @@ class WorkflowConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Specialized parser compiled once at import: the schema is static, so
+# the per-component key unpacking is baked into one code object instead
+# of generic attribute dispatch per field (same idiom as the compiled
+# filter predicates in processing)
+_PARSE_SRC = """\
+def _parse_fast(config_data, get_class, ComponentConfig, WorkflowConfig):
+    components = [
+        ComponentConfig(
+            comp_data["name"],
+            comp_data["type"],
+            comp_data.get("class_name") or get_class(comp_data["type"], comp_data["type"]),
+            comp_data.get("config", {}),
+            comp_data.get("dependencies", []),
+            comp_data.get("enabled", True),
+        )
+        for comp_data in config_data.get("components", ())
+    ]
+    return WorkflowConfig(
+        config_data["name"],
+        config_data.get("description", ""),
+        components,
+        config_data.get("global_config", {}),
+        config_data.get("metadata", {}),
+    )
+"""
+_parse_ns: Dict[str, Any] = {}
+exec(compile(_PARSE_SRC, "<config_parser>", "exec"), _parse_ns)
+_parse_fast = _parse_ns["_parse_fast"]
+
+
 class ConfigManager:
     """Manages workflow and component configurations."""
     
-    def __init__(self):
-        self.component_templates = self._load_component_templates()
-        self.workflow_templates = self._load_workflow_templates()
+    # Read-only views over the module-level literals: every instance
+    # shares the same frozen template objects, so constructing a
+    # ConfigManager allocates nothing
+    component_templates = MappingProxyType(_COMPONENT_TEMPLATES)
+    workflow_templates = MappingProxyType(_WORKFLOW_TEMPLATES)
     
     def load_workflow_config(self, config_path: Union[str, Path]) -> WorkflowConfig:
-        """Load workflow configuration from file."""
+        """Load workflow configuration from file.
+
+        Parsed configs are cached next to the source as a pickle keyed by
+        mtime, so unchanged files skip the YAML/JSON parse on reload.
+        """
         config_path = Path(config_path)
         
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+        cache_path = config_path.with_suffix(config_path.suffix + ".pkl")
+        source_stat = config_path.stat()
+        try:
+            if cache_path.stat().st_mtime >= source_stat.st_mtime:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass  # Missing or stale/corrupt cache: fall through to parse
         
-        if config_path.suffix.lower() == '.json':
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-        elif config_path.suffix.lower() in ['.yml', '.yaml']:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-        else:
+        suffix = config_path.suffix.lower()
+        if suffix in (".yaml", ".yml") and source_stat.st_size > _YAML_STREAM_THRESHOLD:
+            # Event-parse big YAML files: one component materializes at a
+            # time instead of the whole document as nested dicts
+            try:
+                with open(config_path, 'rb') as f:
+                    workflow_config = self._parse_workflow_events(f)
+            except ValueError:
+                # Anchors/aliases and merge keys are not modelled by the
+                # event walk; re-parse with the regular loader instead
+                with open(config_path, 'rb') as f:
+                    workflow_config = self._parse_workflow_config(_yaml_load(f))
+            self._write_config_cache(cache_path, workflow_config)
+            return workflow_config
+
+        loader = _LOADERS.get(suffix)
+        if loader is None:
             raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
+        # Binary mode: both C parsers consume bytes directly
+        with open(config_path, 'rb') as f:
+            config_data = loader(f)
         
-        return self._parse_workflow_config(config_data)
+        workflow_config = self._parse_workflow_config(config_data)
+        self._write_config_cache(cache_path, workflow_config)
+        return workflow_config
+
+    @staticmethod
+    def _write_config_cache(cache_path: Path, workflow_config: WorkflowConfig) -> None:
+        """Atomically write the pickle cache; best-effort only."""
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(workflow_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # A read-only config directory should not break loading
     
     def save_workflow_config(self, workflow_config: WorkflowConfig, config_path: Union[str, Path]) -> None:
         """Save workflow configuration to file."""
@@ -60,26 +559,25 @@ class ConfigManager:
         
         config_data = self._serialize_workflow_config(workflow_config)
         
-        if config_path.suffix.lower() == '.json':
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
-        elif config_path.suffix.lower() in ['.yml', '.yaml']:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
-        else:
+        suffix = config_path.suffix.lower()
+        if suffix == ".json" and orjson is not None:
+            # One bytes buffer straight to disk, no str round-trip
+            config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            return
+        dumper = _DUMPERS.get(suffix)
+        if dumper is None:
             raise ValueError(f"Unsupported configuration file format: {config_path.suffix}")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            dumper(config_data, f)
     
     def create_workflow_from_template(self, template_name: str, **kwargs) -> WorkflowConfig:
         """Create a workflow configuration from a template."""
         if template_name not in self.workflow_templates:
             raise ValueError(f"Unknown workflow template: {template_name}")
         
-        template = self.workflow_templates[template_name].copy()
-        
-        # Replace template variables
-        for key, value in kwargs.items():
-            template = self._replace_template_variables(template, key, value)
-        
+        # One walk substitutes every placeholder, instead of rebuilding
+        # the whole tree once per keyword argument
+        template = self._render_template(self.workflow_templates[template_name], kwargs)
         return self._parse_workflow_config(template)
     
     def get_component_config_template(self, component_type: str) -> Dict[str, Any]:
@@ -87,56 +585,127 @@ class ConfigManager:
         if component_type not in self.component_templates:
             raise ValueError(f"Unknown component type: {component_type}")
         
-        return self.component_templates[component_type].copy()
+        # Deep copy: a shallow one would alias the nested default_config
+        # and config_types dicts back into the shared template
+        return deepcopy(self.component_templates[component_type])
     
     def validate_workflow_config(self, workflow_config: WorkflowConfig) -> List[str]:
         """Validate workflow configuration and return list of errors."""
-        errors = []
-        
-        # Check component dependencies
+        # Check component dependencies with one set difference per
+        # component instead of a per-edge membership loop
         component_names = {comp.name for comp in workflow_config.components}
-        
-        for component in workflow_config.components:
-            for dependency in component.dependencies:
-                if dependency not in component_names:
-                    errors.append(f"Component '{component.name}' depends on missing component '{dependency}'")
+        errors = [
+            f"Component '{component.name}' depends on missing component '{dependency}'"
+            for component in workflow_config.components
+            for dependency in set(component.dependencies).difference(component_names)
+        ]
         
         # Validate individual component configurations
         for component in workflow_config.components:
-            component_errors = self._validate_component_config(component)
-            errors.extend(component_errors)
+            errors.extend(self._validate_component_config(component))
         
         return errors
-    
+
+    def validate_and_build(
+        self,
+        workflow_config: WorkflowConfig,
+        component_factory: Callable[[ComponentConfig], Any],
+    ) -> Tuple[Optional[Any], List[str]]:
+        """Validate a config and build its Workflow in one pass.
+
+        Returns ``(workflow, errors)``. Config-level errors short-circuit
+        before any component is constructed; graph-level errors (cycles,
+        invalid component configs) are collected from the built workflow,
+        which is discarded on failure. ``component_factory`` maps a
+        ComponentConfig to a Component instance, keeping class resolution
+        at the call site.
+        """
+        errors = self.validate_workflow_config(workflow_config)
+        if errors:
+            return None, errors
+
+        from ..core.workflow import Workflow
+
+        workflow = Workflow(workflow_config.name, config=workflow_config.global_config)
+        enabled = [comp for comp in workflow_config.components if comp.enabled]
+        for comp_config in enabled:
+            workflow.add_component(component_factory(comp_config))
+        try:
+            workflow.connect_components_bulk(
+                [(dep, comp.name) for comp in enabled for dep in comp.dependencies]
+            )
+        except ValueError as e:
+            return None, [str(e)]
+
+        graph_errors = workflow.validate()
+        if graph_errors:
+            return None, graph_errors
+        return workflow, []
+
+    def _parse_workflow_events(self, stream) -> WorkflowConfig:
+        """Build a WorkflowConfig from YAML parse events.
+
+        Components are constructed as soon as their mapping closes, so
+        peak memory tracks the largest single component rather than the
+        full document tree.
+        """
+        events = yaml.parse(stream, Loader=_YamlLoader)
+        get_class = _DEFAULT_CLASS_NAMES.get
+
+        event = next(events)
+        while not isinstance(event, yaml.MappingStartEvent):
+            event = next(events)
+
+        name = ""
+        description = ""
+        components: List[ComponentConfig] = []
+        global_config: Dict[str, Any] = {}
+        metadata: Dict[str, Any] = {}
+
+        while True:
+            event = next(events)
+            if isinstance(event, yaml.MappingEndEvent):
+                break
+            key = _resolve_scalar(event)
+            if key == "components":
+                event = next(events)
+                if isinstance(event, yaml.SequenceStartEvent):
+                    while True:
+                        event = next(events)
+                        if isinstance(event, yaml.SequenceEndEvent):
+                            break
+                        comp_data = _build_yaml_value(events, event)
+                        components.append(ComponentConfig(
+                            comp_data["name"],
+                            comp_data["type"],
+                            comp_data.get("class_name") or get_class(comp_data["type"], comp_data["type"]),
+                            comp_data.get("config", {}),
+                            comp_data.get("dependencies", []),
+                            comp_data.get("enabled", True),
+                        ))
+            elif key == "name":
+                name = _build_yaml_value(events, next(events))
+            elif key == "description":
+                description = _build_yaml_value(events, next(events))
+            elif key == "global_config":
+                global_config = _build_yaml_value(events, next(events))
+            elif key == "metadata":
+                metadata = _build_yaml_value(events, next(events))
+            else:
+                _build_yaml_value(events, next(events))  # skip unknown keys
+
+        return WorkflowConfig(name, description, components, global_config, metadata)
+
     def _parse_workflow_config(self, config_data: Dict[str, Any]) -> WorkflowConfig:
         """Parse workflow configuration from dictionary."""
-        components = []
-        
-        for comp_data in config_data.get("components", []):
-            component = ComponentConfig(
-                name=comp_data["name"],
-                type=comp_data["type"],
-                class_name=comp_data.get("class_name", self._get_default_class_name(comp_data["type"])),
-                config=comp_data.get("config", {}),
-                dependencies=comp_data.get("dependencies", []),
-                enabled=comp_data.get("enabled", True)
-            )
-            components.append(component)
-        
-        return WorkflowConfig(
-            name=config_data["name"],
-            description=config_data.get("description", ""),
-            components=components,
-            global_config=config_data.get("global_config", {}),
-            metadata=config_data.get("metadata", {})
+        return _parse_fast(
+            config_data, _DEFAULT_CLASS_NAMES.get, ComponentConfig, WorkflowConfig
         )
     
     def _serialize_workflow_config(self, workflow_config: WorkflowConfig) -> Dict[str, Any]:
         """Serialize workflow configuration to dictionary."""
-        components_data = []
-        
-        for component in workflow_config.components:
-            comp_data = {
+        components_data = [
+            {
                 "name": component.name,
                 "type": component.type,
                 "class_name": component.class_name,
@@ -144,7 +713,8 @@ class ConfigManager:
                 "dependencies": component.dependencies,
                 "enabled": component.enabled
             }
-            components_data.append(comp_data)
+            for component in workflow_config.components
+        ]
         
         return {
             "name": workflow_config.name,
@@ -181,339 +751,25 @@ class ConfigManager:
         
         return errors
     
-    def _get_default_class_name(self, component_type: str) -> str:
+    @staticmethod
+    def _get_default_class_name(component_type: str) -> str:
         """Get default class name for component type."""
-        class_mapping = {
-            "file_ingestion": "FileIngestion",
-            "api_ingestion": "APIIngestion",
-            "database_ingestion": "DatabaseIngestion",
-            "filter_processor": "FilterProcessor",
-            "transform_processor": "TransformProcessor",
-            "aggregation_processor": "AggregationProcessor",
-            "deterministic_reasoning": "DeterministicReasoning",
-            "probabilistic_reasoning": "ProbabilisticReasoning",
-            "merge_aggregation": "MergeAggregation",
-            "voting_aggregation": "VotingAggregation",
-            "weighted_aggregation": "WeightedAggregation",
-            "consensus_aggregation": "ConsensusAggregation",
-            "file_output": "FileOutput",
-            "console_output": "ConsoleOutput",
-            "api_output": "APIOutput"
-        }
-        return class_mapping.get(component_type, component_type)
+        return _DEFAULT_CLASS_NAMES.get(component_type, component_type)
     
-    def _load_component_templates(self) -> Dict[str, Any]:
-        """Load component configuration templates."""
-        return {
-            "file_ingestion": {
-                "required_config": ["source_path"],
-                "config_types": {
-                    "source_path": str,
-                    "source_type": str
-                },
-                "default_config": {
-                    "source_type": "file"
-                }
-            },
-            "api_ingestion": {
-                "required_config": ["url"],
-                "config_types": {
-                    "url": str,
-                    "method": str,
-                    "headers": dict,
-                    "params": dict
-                },
-                "default_config": {
-                    "method": "GET",
-                    "headers": {},
-                    "params": {}
-                }
-            },
-            "database_ingestion": {
-                "required_config": ["connection_string", "query"],
-                "config_types": {
-                    "connection_string": str,
-                    "query": str
-                }
-            },
-            "filter_processor": {
-                "required_config": [],
-                "config_types": {
-                    "filter_conditions": dict
-                },
-                "default_config": {
-                    "filter_conditions": {}
-                }
-            },
-            "transform_processor": {
-                "required_config": [],
-                "config_types": {
-                    "transformations": dict
-                },
-                "default_config": {
-                    "transformations": {}
-                }
-            },
-            "aggregation_processor": {
-                "required_config": [],
-                "config_types": {
-                    "aggregation_functions": dict,
-                    "group_by": str
-                }
-            },
-            "deterministic_reasoning": {
-                "required_config": [],
-                "config_types": {
-                    "rules": list,
-                    "functions": dict
-                },
-                "default_config": {
-                    "rules": [],
-                    "functions": {}
-                }
-            },
-            "probabilistic_reasoning": {
-                "required_config": [],
-                "config_types": {
-                    "model_config": dict,
-                    "prompts": dict,
-                    "temperature": (int, float)
-                },
-                "default_config": {
-                    "model_config": {},
-                    "prompts": {},
-                    "temperature": 0.7
-                }
-            },
-            "merge_aggregation": {
-                "required_config": [],
-                "config_types": {
-                    "aggregation_strategy": str,
-                    "weighting": dict
-                },
-                "default_config": {
-                    "aggregation_strategy": "merge",
-                    "weighting": {}
-                }
-            },
-            "voting_aggregation": {
-                "required_config": [],
-                "config_types": {
-                    "voting_method": str,
-                    "confidence_threshold": (int, float)
-                },
-                "default_config": {
-                    "voting_method": "majority",
-                    "confidence_threshold": 0.5
-                }
-            },
-            "weighted_aggregation": {
-                "required_config": [],
-                "config_types": {
-                    "weighting": dict
-                },
-                "default_config": {
-                    "weighting": {}
-                }
-            },
-            "consensus_aggregation": {
-                "required_config": [],
-                "config_types": {
-                    "consensus_threshold": (int, float),
-                    "min_agreement": int
-                },
-                "default_config": {
-                    "consensus_threshold": 0.7,
-                    "min_agreement": 2
-                }
-            },
-            "file_output": {
-                "required_config": [],
-                "config_types": {
-                    "output_format": str,
-                    "output_path": str
-                },
-                "default_config": {
-                    "output_format": "json"
-                }
-            },
-            "console_output": {
-                "required_config": [],
-                "config_types": {},
-                "default_config": {}
-            },
-            "api_output": {
-                "required_config": ["api_endpoint"],
-                "config_types": {
-                    "api_endpoint": str,
-                    "api_method": str,
-                    "api_headers": dict
-                },
-                "default_config": {
-                    "api_method": "POST",
-                    "api_headers": {}
-                }
-            }
-        }
-    
-    def _load_workflow_templates(self) -> Dict[str, Any]:
-        """Load workflow configuration templates."""
-        return {
-            "simple_analysis": {
-                "name": "Simple Data Analysis",
-                "description": "Basic data ingestion, processing, and output workflow",
-                "components": [
-                    {
-                        "name": "data_source",
-                        "type": "file_ingestion",
-                        "config": {
-                            "source_path": "{input_file}",
-                            "source_type": "file"
-                        }
-                    },
-                    {
-                        "name": "processor",
-                        "type": "filter_processor",
-                        "dependencies": ["data_source"],
-                        "config": {
-                            "filter_conditions": {}
-                        }
-                    },
-                    {
-                        "name": "output",
-                        "type": "console_output",
-                        "dependencies": ["processor"]
-                    }
-                ]
-            },
-            "ml_pipeline": {
-                "name": "Machine Learning Pipeline",
-                "description": "Data ingestion, processing, ML reasoning, and output",
-                "components": [
-                    {
-                        "name": "data_ingestion",
-                        "type": "file_ingestion",
-                        "config": {
-                            "source_path": "{dataset_path}",
-                            "source_type": "file"
-                        }
-                    },
-                    {
-                        "name": "data_processing",
-                        "type": "transform_processor",
-                        "dependencies": ["data_ingestion"],
-                        "config": {
-                            "transformations": {
-                                "text": "lowercase"
-                            }
-                        }
-                    },
-                    {
-                        "name": "ml_reasoning",
-                        "type": "probabilistic_reasoning",
-                        "dependencies": ["data_processing"],
-                        "config": {
-                            "model_config": {
-                                "model_name": "{model_name}",
-                                "api_key": "{api_key}"
-                            },
-                            "prompts": {
-                                "analysis": {
-                                    "template": "Analyze this data: {data}"
-                                }
-                            },
-                            "temperature": 0.3
-                        }
-                    },
-                    {
-                        "name": "results_output",
-                        "type": "file_output",
-                        "dependencies": ["ml_reasoning"],
-                        "config": {
-                            "output_format": "json",
-                            "output_path": "{output_path}"
-                        }
-                    }
-                ]
-            },
-            "multi_source_analysis": {
-                "name": "Multi-Source Analysis",
-                "description": "Combine multiple data sources with consensus reasoning",
-                "components": [
-                    {
-                        "name": "source1",
-                        "type": "file_ingestion",
-                        "config": {
-                            "source_path": "{source1_path}",
-                            "source_type": "file"
-                        }
-                    },
-                    {
-                        "name": "source2",
-                        "type": "api_ingestion",
-                        "config": {
-                            "url": "{api_url}",
-                            "method": "GET"
-                        }
-                    },
-                    {
-                        "name": "reasoning1",
-                        "type": "deterministic_reasoning",
-                        "dependencies": ["source1"],
-                        "config": {
-                            "rules": [
-                                {
-                                    "name": "threshold_check",
-                                    "condition": {
-                                        "type": "count_threshold",
-                                        "threshold": 10
-                                    },
-                                    "conclusion": "Sufficient data for analysis"
-                                }
-                            ]
-                        }
-                    },
-                    {
-                        "name": "reasoning2",
-                        "type": "probabilistic_reasoning",
-                        "dependencies": ["source2"],
-                        "config": {
-                            "prompts": {
-                                "classification": {
-                                    "template": "Classify this data: {data}"
-                                }
-                            }
-                        }
-                    },
-                    {
-                        "name": "consensus",
-                        "type": "consensus_aggregation",
-                        "dependencies": ["reasoning1", "reasoning2"],
-                        "config": {
-                            "consensus_threshold": 0.7,
-                            "min_agreement": 1
-                        }
-                    },
-                    {
-                        "name": "final_output",
-                        "type": "file_output",
-                        "dependencies": ["consensus"],
-                        "config": {
-                            "output_format": "html",
-                            "output_path": "{output_file}"
-                        }
-                    }
-                ]
-            }
-        }
-    
-    def _replace_template_variables(self, template: Any, key: str, value: Any) -> Any:
-        """Replace template variables recursively."""
+        
+    def _render_template(self, template: Any, variables: Dict[str, Any]) -> Any:
+        """Substitute all template variables in a single recursive walk.
+
+        Unknown placeholders are left intact so templates with runtime
+        placeholders (e.g. prompt {data}) render correctly.
+        """
         if isinstance(template, dict):
-            return {k: self._replace_template_variables(v, key, value) for k, v in template.items()}
+            return {k: self._render_template(v, variables) for k, v in template.items()}
         elif isinstance(template, list):
-            return [self._replace_template_variables(item, key, value) for item in template]
+            return [self._render_template(item, variables) for item in template]
         elif isinstance(template, str):
-            return template.replace(f"{{{key}}}", str(value))
+            return _PLACEHOLDER_RE.sub(
+                lambda m: str(variables.get(m.group(1), m.group(0))), template
+            )
         else:
             return template
\ No newline at end of file
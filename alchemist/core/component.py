@@ -18,50 +18,102 @@ class ComponentStatus(Enum):
 @dataclass
 class ComponentResult:
     """Result of a component execution."""
+    __slots__ = ("status", "data", "metadata", "errors", "execution_time")
+
     status: ComponentStatus
     data: Any
     metadata: Dict[str, Any]
     errors: List[str]
     execution_time: float
 
+    # Shared empty-errors singleton for successful results; treat it as
+    # read-only (no annotation, so the dataclass does not see a field)
+    _EMPTY_ERRORS = ()
+
+    @classmethod
+    def ok(cls, data: Any, execution_time: float = 0.0, **metadata: Any) -> "ComponentResult":
+        """Build a COMPLETED result, skipping per-field boilerplate."""
+        result = cls.__new__(cls)
+        result.status = ComponentStatus.COMPLETED
+        result.data = data
+        result.metadata = metadata
+        result.errors = cls._EMPTY_ERRORS
+        result.execution_time = execution_time
+        return result
+
+    @classmethod
+    def fail(cls, error: str, execution_time: float = 0.0) -> "ComponentResult":
+        """Build a FAILED result carrying a single error message."""
+        result = cls.__new__(cls)
+        result.status = ComponentStatus.FAILED
+        result.data = None
+        result.metadata = {}
+        result.errors = [error]
+        result.execution_time = execution_time
+        return result
+
 
 class Component(ABC):
     """Base class for all workflow components."""
-    
+
+    __slots__ = ("name", "config", "status", "_deps", "_outs", "_deps_view")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
         self.status = ComponentStatus.PENDING
-        self.dependencies: List[str] = []
-        self.outputs: List[str] = []
-        
+        # Insertion-ordered dicts: O(1) dedup on add, stable iteration
+        self._deps: Dict[str, None] = {}
+        self._outs: Dict[str, None] = {}
+        self._deps_view: Optional[tuple] = None
+
     @abstractmethod
     async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
         """Execute the component with given inputs."""
         pass
-    
+
     @abstractmethod
     def validate_config(self) -> bool:
         """Validate component configuration."""
         pass
-    
+
+    @property
+    def dependencies(self) -> List[str]:
+        """Dependency component names, in insertion order."""
+        return list(self._deps)
+
+    @property
+    def outputs(self) -> List[str]:
+        """Output identifiers, in insertion order."""
+        return list(self._outs)
+
     def add_dependency(self, dependency: str) -> None:
         """Add a dependency component."""
-        if dependency not in self.dependencies:
-            self.dependencies.append(dependency)
-    
+        self._deps[dependency] = None
+        self._deps_view = None
+
     def add_output(self, output: str) -> None:
         """Add an output identifier."""
-        if output not in self.outputs:
-            self.outputs.append(output)
-    
+        self._outs[output] = None
+
+    def iter_dependencies(self):
+        """Iterate dependency names without allocating a list."""
+        return iter(self._deps)
+
+    def dependencies_view(self) -> tuple:
+        """Read-only dependency names; cached until the next add."""
+        view = self._deps_view
+        if view is None:
+            view = self._deps_view = tuple(self._deps)
+        return view
+
     def get_dependencies(self) -> List[str]:
         """Get list of dependency components."""
-        return self.dependencies.copy()
-    
+        return list(self._deps)
+
     def get_outputs(self) -> List[str]:
         """Get list of output identifiers."""
-        return self.outputs.copy()
+        return list(self._outs)
     
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}', status={self.status.value})"
\ No newline at end of file
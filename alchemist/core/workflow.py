@@ -1,12 +1,18 @@
 """Workflow orchestration system."""
 
 import asyncio
+import sys
+from collections import deque
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import time
 import logging
 
+# dataclass slots need 3.10+; plain dicts remain the fallback below
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 from .component import Component, ComponentResult, ComponentStatus
 
 
@@ -19,7 +25,7 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowResult:
     """Result of workflow execution."""
     status: WorkflowStatus
@@ -36,7 +42,13 @@ class Workflow:
         self.name = name
         self.config = config or {}
         self.components: Dict[str, Component] = {}
-        self.execution_order: List[str] = []
+        self._execution_order: List[str] = []
+        self._successors: Dict[str, List[str]] = {}
+        self._in_degree: Dict[str, int] = {}
+        self._dep_tuples: Dict[str, tuple] = {}
+        self._position: Dict[str, int] = {}
+        self._graph_cache: Optional[Dict[str, List[str]]] = None
+        self._order_dirty = False
         self.status = WorkflowStatus.PENDING
         self.logger = logging.getLogger(f"alchemist.workflow.{name}")
         
@@ -46,7 +58,8 @@ class Workflow:
             raise ValueError(f"Component '{component.name}' already exists in workflow")
         
         self.components[component.name] = component
-        self._update_execution_order()
+        self._graph_cache = None
+        self._order_dirty = True
     
     def remove_component(self, name: str) -> None:
         """Remove a component from the workflow."""
@@ -54,106 +67,223 @@ class Workflow:
             raise ValueError(f"Component '{name}' not found in workflow")
         
         del self.components[name]
-        self._update_execution_order()
+        self._graph_cache = None
+        self._order_dirty = True
     
     def connect_components(self, source: str, target: str) -> None:
-        """Connect two components (source -> target)."""
+        """Connect two components (source -> target).
+
+        An edge that already respects the current topological order
+        cannot create a cycle, so the cached indexes are patched in
+        place; only order-violating edges pay for a full recompute,
+        which raises here so the caller can see which edge introduced
+        a cycle.
+        """
         if source not in self.components:
             raise ValueError(f"Source component '{source}' not found")
         if target not in self.components:
             raise ValueError(f"Target component '{target}' not found")
-        
-        self.components[target].add_dependency(source)
+
+        target_component = self.components[target]
+        if source in target_component.dependencies_view():
+            return  # Edge already present; nothing to recompute
+
+        target_component.add_dependency(source)
         self.components[source].add_output(target)
+        self._graph_cache = None
+
+        position = self._position
+        if (not self._order_dirty
+                and source in position and target in position
+                and position[source] < position[target]):
+            # Fast path: O(1) incremental update, order stays valid
+            self._successors[source].append(target)
+            self._in_degree[target] += 1
+            self._dep_tuples[target] = target_component.dependencies_view()
+        else:
+            self._update_execution_order()
+
+    def connect_components_bulk(self, edges: List[tuple]) -> None:
+        """Connect many (source, target) pairs with one order recompute.
+
+        Equivalent to calling connect_components per edge but defers the
+        topological sort (and its cycle check) until all edges are in,
+        turning O(E) repeated sorts into a single pass.
+        """
+        components = self.components
+        for source, target in edges:
+            if source not in components:
+                raise ValueError(f"Source component '{source}' not found")
+            if target not in components:
+                raise ValueError(f"Target component '{target}' not found")
+            components[target].add_dependency(source)
+            components[source].add_output(target)
+        self._graph_cache = None
         self._update_execution_order()
+
+    @property
+    def execution_order(self) -> List[str]:
+        """Topological execution order, rebuilt lazily after mutations."""
+        if self._order_dirty:
+            self._update_execution_order()
+        return self._execution_order
     
     def _update_execution_order(self) -> None:
-        """Update the execution order based on dependencies using topological sort."""
-        # Simple topological sort implementation
-        visited = set()
-        temp_visited = set()
+        """Rebuild the execution order with Kahn's in-degree algorithm.
+
+        Iterative BFS over in-degrees: no recursion, and the successor
+        index it builds feeds level-based scheduling.
+        """
+        components = self.components
+        in_degree: Dict[str, int] = {}
+        successors: Dict[str, List[str]] = {name: [] for name in components}
+        
+        dep_tuples: Dict[str, tuple] = {}
+        for name, component in components.items():
+            dependencies = component.dependencies_view()
+            dep_tuples[name] = dependencies
+            degree = 0
+            for dependency in dependencies:
+                if dependency in components:
+                    successors[dependency].append(name)
+                    degree += 1
+            in_degree[name] = degree
+        
+        in_degree_base = dict(in_degree)
+        ready = deque(name for name in components if in_degree[name] == 0)
         order = []
         
-        def visit(node: str) -> None:
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected involving '{node}'")
-            if node in visited:
-                return
-            
-            temp_visited.add(node)
-            for dependency in self.components[node].get_dependencies():
-                if dependency in self.components:
-                    visit(dependency)
-            temp_visited.remove(node)
-            visited.add(node)
+        while ready:
+            node = ready.popleft()
             order.append(node)
+            for successor in successors[node]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
         
-        for component_name in self.components:
-            if component_name not in visited:
-                visit(component_name)
+        if len(order) != len(components):
+            cyclic = next(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Circular dependency detected involving '{cyclic}'")
         
-        self.execution_order = order
+        self._execution_order = order
+        self._successors = successors
+        self._in_degree = in_degree_base
+        self._dep_tuples = dep_tuples
+        self._position = {name: index for index, name in enumerate(order)}
+        self._order_dirty = False
     
-    async def execute(self, initial_inputs: Optional[Dict[str, Any]] = None) -> WorkflowResult:
-        """Execute the workflow."""
-        start_time = time.time()
+    async def execute(self, initial_inputs: Optional[Dict[str, Any]] = None,
+                      frozen: bool = False) -> WorkflowResult:
+        """Execute the workflow.
+
+        Initial inputs are handed to components with no dependencies.
+        Pass frozen=True (or a MappingProxyType) to vouch the mapping is
+        immutable so the engine can skip its defensive copy.
+        """
+        start_time = time.perf_counter()
         self.status = WorkflowStatus.RUNNING
-        self.logger.info(f"Starting workflow '{self.name}' execution")
+        # Deferred %s formatting plus a hoisted level check: a disabled
+        # INFO level costs nothing per component
+        logger = self.logger
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info("Starting workflow '%s' execution", self.name)
         
         result = WorkflowResult(status=WorkflowStatus.RUNNING)
-        component_outputs = initial_inputs or {}
-        
+        if frozen or isinstance(initial_inputs, MappingProxyType):
+            initial = initial_inputs or {}
+        else:
+            initial = dict(initial_inputs) if initial_inputs else {}
+        component_outputs: Dict[str, Any] = {}
+
         try:
-            for component_name in self.execution_order:
-                component = self.components[component_name]
-                
-                self.logger.info(f"Executing component '{component_name}'")
-                component.status = ComponentStatus.RUNNING
-                
-                # Prepare inputs for this component
-                component_inputs = self._prepare_component_inputs(
-                    component, component_outputs
+            if self._order_dirty:
+                self._update_execution_order()
+            
+            # Run level by level: components whose dependencies are all
+            # satisfied execute concurrently, so independent branches
+            # collapse to the critical path
+            in_degree = dict(self._in_degree)
+            successors = self._successors
+            ready = [name for name in self._execution_order if in_degree[name] == 0]
+            
+            while ready:
+                level_results = await asyncio.gather(
+                    *(self._run_component(name, component_outputs, initial) for name in ready)
                 )
                 
-                # Execute component
-                component_result = await component.execute(component_inputs)
-                result.component_results[component_name] = component_result
+                level_failed = False
+                for component_name, component_result in level_results:
+                    result.component_results[component_name] = component_result
+                    
+                    if component_result.status == ComponentStatus.FAILED:
+                        logger.error("Component '%s' failed", component_name)
+                        result.errors.extend(component_result.errors)
+                        level_failed = True
+                    else:
+                        # Store outputs for next components
+                        component_outputs[component_name] = component_result.data
+                        if info_enabled:
+                            logger.info("Component '%s' completed successfully", component_name)
                 
-                if component_result.status == ComponentStatus.FAILED:
-                    self.logger.error(f"Component '{component_name}' failed")
-                    result.errors.extend(component_result.errors)
+                if level_failed:
                     self.status = WorkflowStatus.FAILED
                     result.status = WorkflowStatus.FAILED
                     break
                 
-                # Store outputs for next components
-                component_outputs[component_name] = component_result.data
-                
-                self.logger.info(f"Component '{component_name}' completed successfully")
+                next_ready = []
+                for component_name, _ in level_results:
+                    for successor in successors[component_name]:
+                        in_degree[successor] -= 1
+                        if in_degree[successor] == 0:
+                            next_ready.append(successor)
+                ready = next_ready
             
             if self.status == WorkflowStatus.RUNNING:
                 self.status = WorkflowStatus.COMPLETED
                 result.status = WorkflowStatus.COMPLETED
-                self.logger.info(f"Workflow '{self.name}' completed successfully")
+                if info_enabled:
+                    logger.info("Workflow '%s' completed successfully", self.name)
         
         except Exception as e:
-            self.logger.error(f"Workflow execution failed: {str(e)}")
+            logger.error("Workflow execution failed: %s", str(e))
             self.status = WorkflowStatus.FAILED
             result.status = WorkflowStatus.FAILED
             result.errors.append(str(e))
         
-        result.execution_time = time.time() - start_time
+        result.execution_time = time.perf_counter() - start_time
         return result
     
-    def _prepare_component_inputs(self, component: Component, available_outputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare inputs for a component based on its dependencies."""
-        inputs = {}
-        
-        for dependency in component.get_dependencies():
-            if dependency in available_outputs:
-                inputs[dependency] = available_outputs[dependency]
-        
-        return inputs
+    async def _run_component(self, component_name: str, component_outputs: Dict[str, Any],
+                             initial_inputs: Dict[str, Any]) -> tuple:
+        """Execute one component and return (name, result)."""
+        component = self.components[component_name]
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Executing component '%s'", component_name)
+        component.status = ComponentStatus.RUNNING
+
+        component_inputs = self._prepare_component_inputs(component, component_outputs, initial_inputs)
+        component_result = await component.execute(component_inputs)
+        return component_name, component_result
+
+    def _prepare_component_inputs(self, component: Component, available_outputs: Dict[str, Any],
+                                  initial_inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare inputs for a component based on its dependencies.
+
+        Root components (no dependencies) receive the workflow's initial
+        inputs. Dependency names come from the tuple index cached during
+        the topo rebuild, avoiding the defensive list copy per component
+        per run.
+        """
+        dependencies = self._dep_tuples[component.name]
+        if not dependencies:
+            return initial_inputs
+        return {
+            dependency: available_outputs[dependency]
+            for dependency in dependencies
+            if dependency in available_outputs
+        }
     
     def validate(self) -> List[str]:
         """Validate the workflow configuration."""
@@ -161,7 +291,7 @@ class Workflow:
         
         # Check for missing dependencies
         for component_name, component in self.components.items():
-            for dependency in component.get_dependencies():
+            for dependency in component.iter_dependencies():
                 if dependency not in self.components:
                     errors.append(f"Component '{component_name}' depends on missing component '{dependency}'")
         
@@ -173,10 +303,17 @@ class Workflow:
         return errors
     
     def get_component_graph(self) -> Dict[str, List[str]]:
-        """Get the component dependency graph."""
-        graph = {}
-        for name, component in self.components.items():
-            graph[name] = component.get_dependencies()
+        """Get the component dependency graph.
+
+        Memoized until the next add/remove/connect; treat the returned
+        mapping as read-only.
+        """
+        graph = self._graph_cache
+        if graph is None:
+            graph = self._graph_cache = {
+                name: component.get_dependencies()
+                for name, component in self.components.items()
+            }
         return graph
     
     def __str__(self) -> str:
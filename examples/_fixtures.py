@@ -0,0 +1,45 @@
+"""Shared helpers for the example workflows."""
+
+import json
+import os
+import sys
+import types
+
+try:
+    import orjson  # Fast C JSON serializer (optional)
+except ImportError:
+    orjson = None
+
+
+def freeze_config(config):
+    """Return a read-only view of a component config with interned keys.
+
+    Components only ever read their config; interned keys let the hot
+    per-record lookups compare by pointer identity, and the proxy keeps
+    the dict safe to share.
+    """
+    return types.MappingProxyType({
+        sys.intern(k) if isinstance(k, str) else k: v
+        for k, v in config.items()
+    })
+
+
+def dump_json_fast(path, obj):
+    """Serialize obj and write it to path in a single buffered write.
+
+    Writing the encoded bytes through a raw fd skips the TextIOWrapper
+    layer entirely; with orjson installed the whole file is one encode
+    plus one os.write.
+    """
+    # Fixtures are consumed straight back by FileIngestion and then
+    # deleted, so compact output beats pretty-printing on both ends
+    if orjson is not None:
+        payload = orjson.dumps(obj)
+    else:
+        payload = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
@@ -1,10 +1,17 @@
 """Configuration-based workflow example using ConfigManager."""
 
 import asyncio
-import json
+import functools
+import sys
+import tempfile
+import types
 from pathlib import Path
 
-from alchemist import Workflow
+try:
+    from ._fixtures import dump_json_fast, freeze_config
+except ImportError:  # Run directly as a script
+    from _fixtures import dump_json_fast, freeze_config
+
 from alchemist.config.manager import ConfigManager
 from alchemist.components.ingestion import FileIngestion, APIIngestion, DatabaseIngestion
 from alchemist.components.processing import FilterProcessor, TransformProcessor, AggregationProcessor
@@ -13,8 +20,9 @@ from alchemist.components.aggregation import MergeAggregation, VotingAggregation
 from alchemist.components.output import FileOutput, ConsoleOutput, APIOutput
 
 
-# Component class mapping
-COMPONENT_CLASSES = {
+# Component class mapping; interned keys make lookups an identity
+# comparison and the proxy keeps the table read-only
+COMPONENT_CLASSES = types.MappingProxyType({sys.intern(k): v for k, v in {
     "FileIngestion": FileIngestion,
     "APIIngestion": APIIngestion,
     "DatabaseIngestion": DatabaseIngestion,
@@ -30,11 +38,12 @@ COMPONENT_CLASSES = {
     "FileOutput": FileOutput,
     "ConsoleOutput": ConsoleOutput,
     "APIOutput": APIOutput
-}
+}.items()})
 
 
-async def create_sample_config():
+async def create_sample_config(work_dir):
     """Create a sample workflow configuration file."""
+    work_path = Path(work_dir)
     config = {
         "name": "Sales Data Analysis Pipeline",
         "description": "Analyze sales data from multiple sources with ML insights",
@@ -53,7 +62,7 @@ async def create_sample_config():
                 "type": "file_ingestion",
                 "class_name": "FileIngestion",
                 "config": {
-                    "source_path": "sales_data.json",
+                    "source_path": str(work_path / "sales_data.json"),
                     "source_type": "file"
                 },
                 "enabled": True
@@ -63,7 +72,7 @@ async def create_sample_config():
                 "type": "file_ingestion",
                 "class_name": "FileIngestion",
                 "config": {
-                    "source_path": "customer_data.json",
+                    "source_path": str(work_path / "customer_data.json"),
                     "source_type": "file"
                 },
                 "enabled": True
@@ -176,15 +185,15 @@ async def create_sample_config():
         ]
     }
     
-    config_path = Path("workflow_config.json")
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
-    
+    config_path = work_path / "workflow_config.json"
+    dump_json_fast(config_path, config)
+
     return str(config_path)
 
 
-async def create_sample_data():
+async def create_sample_data(work_dir):
     """Create sample data files for the workflow."""
+    work_path = Path(work_dir)
     sales_data = [
         {"id": 1, "customer_id": "C001", "product": "Laptop", "amount": 1200, "status": "completed"},
         {"id": 2, "customer_id": "C002", "product": "Mouse", "amount": 25, "status": "completed"},
@@ -200,71 +209,58 @@ async def create_sample_data():
         {"customer_id": "C004", "name": "alice brown", "segment": "consumer", "region": "west"}
     ]
     
-    with open("sales_data.json", 'w') as f:
-        json.dump(sales_data, f, indent=2)
-    
-    with open("customer_data.json", 'w') as f:
-        json.dump(customer_data, f, indent=2)
-    
-    return "sales_data.json", "customer_data.json"
+    sales_path = work_path / "sales_data.json"
+    customer_path = work_path / "customer_data.json"
+
+    dump_json_fast(sales_path, sales_data)
+    dump_json_fast(customer_path, customer_data)
+
+    return str(sales_path), str(customer_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _manager():
+    """Process-wide ConfigManager shared by every entrypoint."""
+    return ConfigManager()
+
+
+@functools.lru_cache(maxsize=None)
+def _component_factory(class_name):
+    """Resolve a class name to its constructor once per distinct name."""
+    try:
+        return COMPONENT_CLASSES[class_name]
+    except KeyError:
+        raise ValueError(f"Unknown component class: {class_name}")
 
 
 def create_component_from_config(component_config):
     """Create a component instance from configuration."""
-    class_name = component_config.class_name
-    
-    if class_name not in COMPONENT_CLASSES:
-        raise ValueError(f"Unknown component class: {class_name}")
-    
-    component_class = COMPONENT_CLASSES[class_name]
-    return component_class(component_config.name, component_config.config)
+    factory = _component_factory(sys.intern(component_config.class_name))
+    return factory(component_config.name, freeze_config(component_config.config))
 
 
-async def run_config_based_workflow():
+async def run_config_based_workflow(work_dir):
     """Run a workflow based on configuration file."""
-    
+
     # Create sample data and config
-    sales_file, customer_file = await create_sample_data()
-    config_file = await create_sample_config()
+    sales_file, customer_file = await create_sample_data(work_dir)
+    config_file = await create_sample_config(work_dir)
     
     # Load configuration
-    config_manager = ConfigManager()
+    config_manager = _manager()
     workflow_config = config_manager.load_workflow_config(config_file)
     
     print(f"Loaded workflow: {workflow_config.name}")
     print(f"Description: {workflow_config.description}")
     
-    # Validate configuration
-    validation_errors = config_manager.validate_workflow_config(workflow_config)
-    if validation_errors:
-        print("Configuration validation errors:")
-        for error in validation_errors:
-            print(f"  - {error}")
-        return
-    
-    # Create workflow
-    workflow = Workflow(
-        workflow_config.name,
-        config=workflow_config.global_config
+    # Validate and build in one pass; config-level errors short-circuit
+    # before any component object is constructed
+    workflow, validation_errors = config_manager.validate_and_build(
+        workflow_config, create_component_from_config
     )
-    
-    # Create and add components
-    for comp_config in workflow_config.components:
-        if not comp_config.enabled:
-            continue
-        
-        component = create_component_from_config(comp_config)
-        workflow.add_component(component)
-        
-        # Add dependencies
-        for dependency in comp_config.dependencies:
-            workflow.connect_components(dependency, comp_config.name)
-    
-    # Validate workflow
-    workflow_errors = workflow.validate()
-    if workflow_errors:
+    if workflow is None:
         print("Workflow validation errors:")
-        for error in workflow_errors:
+        for error in validation_errors:
             print(f"  - {error}")
         return
     
@@ -277,15 +273,16 @@ async def run_config_based_workflow():
     print(f"\\nWorkflow completed with status: {result.status.value}")
     print(f"Total execution time: {result.execution_time:.2f} seconds")
     
-    # Display component results
-    print("\\nComponent Results:")
+    # Display component results in one buffered write instead of a
+    # stdout lock/flush per line
+    lines = ["\\nComponent Results:"]
     for comp_name, comp_result in result.component_results.items():
         status_icon = "✅" if comp_result.status.value == "completed" else "❌"
-        print(f"  {status_icon} {comp_name}: {comp_result.status.value} ({comp_result.execution_time:.2f}s)")
-        
+        lines.append(f"  {status_icon} {comp_name}: {comp_result.status.value} ({comp_result.execution_time:.2f}s)")
+
         if comp_result.errors:
-            for error in comp_result.errors:
-                print(f"    ❌ {error}")
+            lines.extend(f"    ❌ {error}" for error in comp_result.errors)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     if result.errors:
         print(f"\\nWorkflow errors: {result.errors}")
@@ -298,20 +295,15 @@ async def run_config_based_workflow():
     print("Available workflow templates:")
     for template_name in config_manager.workflow_templates.keys():
         print(f"  - {template_name}")
-    
-    # Clean up
-    Path(sales_file).unlink()
-    Path(customer_file).unlink()
-    Path(config_file).unlink()
 
 
-async def demonstrate_templates():
+async def demonstrate_templates(work_dir):
     """Demonstrate workflow creation from templates."""
     print("\\n" + "="*50)
     print("TEMPLATE DEMONSTRATION")
     print("="*50)
-    
-    config_manager = ConfigManager()
+
+    config_manager = _manager()
     
     # Create workflow from template
     workflow_config = config_manager.create_workflow_from_template(
@@ -323,13 +315,23 @@ async def demonstrate_templates():
     print(f"Components: {[comp.name for comp in workflow_config.components]}")
     
     # Save the template-based config
-    config_manager.save_workflow_config(workflow_config, "template_workflow.json")
+    template_path = Path(work_dir) / "template_workflow.json"
+    config_manager.save_workflow_config(workflow_config, template_path)
     print("Saved template-based workflow to: template_workflow.json")
-    
-    # Clean up
-    Path("template_workflow.json").unlink()
+
+
+async def main():
+    """Run both demos concurrently on one event loop."""
+    # One loop bootstrap instead of two asyncio.run calls; the template
+    # demo overlaps with the workflow's I/O waits. Distinct tempdirs
+    # keep the fixtures from colliding and are removed recursively
+    with tempfile.TemporaryDirectory() as workflow_dir, \
+            tempfile.TemporaryDirectory() as template_dir:
+        await asyncio.gather(
+            run_config_based_workflow(workflow_dir),
+            demonstrate_templates(template_dir),
+        )
 
 
 if __name__ == "__main__":
-    asyncio.run(run_config_based_workflow())
-    asyncio.run(demonstrate_templates())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
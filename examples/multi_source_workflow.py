@@ -1,9 +1,15 @@
 """Multi-source workflow example with consensus aggregation."""
 
 import asyncio
-import json
+import sys
+import tempfile
 from pathlib import Path
 
+try:
+    from ._fixtures import dump_json_fast, freeze_config
+except ImportError:  # Run directly as a script
+    from _fixtures import dump_json_fast, freeze_config
+
 from alchemist import Workflow
 from alchemist.components.ingestion import FileIngestion, APIIngestion
 from alchemist.components.reasoning import DeterministicReasoning, ProbabilisticReasoning
@@ -11,7 +17,7 @@ from alchemist.components.aggregation import ConsensusAggregation
 from alchemist.components.output import FileOutput
 
 
-async def create_test_data():
+async def create_test_data(work_dir):
     """Create test data files."""
     # Create first data source
     data1 = [
@@ -27,23 +33,20 @@ async def create_test_data():
         {"device": "B3", "reading": 36.1, "quality": "poor"}
     ]
     
-    path1 = Path("sensor_data.json")
-    path2 = Path("device_data.json")
-    
-    with open(path1, 'w') as f:
-        json.dump(data1, f, indent=2)
-    
-    with open(path2, 'w') as f:
-        json.dump(data2, f, indent=2)
-    
+    path1 = Path(work_dir) / "sensor_data.json"
+    path2 = Path(work_dir) / "device_data.json"
+
+    dump_json_fast(path1, data1)
+    dump_json_fast(path2, data2)
+
     return str(path1), str(path2)
 
 
-async def run_multi_source_workflow():
+async def run_multi_source_workflow(work_dir):
     """Run workflow with multiple data sources and consensus aggregation."""
-    
+
     # Create test data
-    sensor_file, device_file = await create_test_data()
+    sensor_file, device_file = await create_test_data(work_dir)
     
     # Create workflow
     workflow = Workflow("multi_source_analysis", config={
@@ -51,15 +54,15 @@ async def run_multi_source_workflow():
     })
     
     # Data Sources
-    sensor_ingestion = FileIngestion("sensor_data", config={
+    sensor_ingestion = FileIngestion("sensor_data", config=freeze_config({
         "source_path": sensor_file,
         "source_type": "file"
-    })
+    }))
     
-    device_ingestion = FileIngestion("device_data", config={
+    device_ingestion = FileIngestion("device_data", config=freeze_config({
         "source_path": device_file,
         "source_type": "file"
-    })
+    }))
     
     # Alternative: API ingestion (commented out for demo)
     # api_ingestion = APIIngestion("api_data", config={
@@ -69,7 +72,7 @@ async def run_multi_source_workflow():
     # })
     
     # Reasoning Components
-    sensor_reasoning = DeterministicReasoning("sensor_analysis", config={
+    sensor_reasoning = DeterministicReasoning("sensor_analysis", config=freeze_config({
         "rules": [
             {
                 "name": "temperature_alert",
@@ -113,9 +116,9 @@ async def run_multi_source_workflow():
                 "operation": "count"
             }
         }
-    })
+    }))
     
-    device_reasoning = ProbabilisticReasoning("device_analysis", config={
+    device_reasoning = ProbabilisticReasoning("device_analysis", config=freeze_config({
         "model_config": {
             "model_name": "gpt-3.5-turbo",
             "max_tokens": 150
@@ -129,19 +132,19 @@ async def run_multi_source_workflow():
             }
         },
         "temperature": 0.3
-    })
+    }))
     
     # Consensus Aggregation
-    consensus = ConsensusAggregation("consensus_analysis", config={
+    consensus = ConsensusAggregation("consensus_analysis", config=freeze_config({
         "consensus_threshold": 0.6,
         "min_agreement": 1
-    })
+    }))
     
     # Output
-    output = FileOutput("results", config={
+    output = FileOutput("results", config=freeze_config({
         "output_format": "html",
         "output_path": "multi_source_results.html"
-    })
+    }))
     
     # Add components to workflow
     workflow.add_component(sensor_ingestion)
@@ -151,12 +154,14 @@ async def run_multi_source_workflow():
     workflow.add_component(consensus)
     workflow.add_component(output)
     
-    # Connect components
-    workflow.connect_components("sensor_data", "sensor_analysis")
-    workflow.connect_components("device_data", "device_analysis")
-    workflow.connect_components("sensor_analysis", "consensus_analysis")
-    workflow.connect_components("device_analysis", "consensus_analysis")
-    workflow.connect_components("consensus_analysis", "results")
+    # Connect components; one sort for the whole edge list
+    workflow.connect_components_bulk([
+        ("sensor_data", "sensor_analysis"),
+        ("device_data", "device_analysis"),
+        ("sensor_analysis", "consensus_analysis"),
+        ("device_analysis", "consensus_analysis"),
+        ("consensus_analysis", "results"),
+    ])
     
     # Validate and execute
     validation_errors = workflow.validate()
@@ -168,28 +173,36 @@ async def run_multi_source_workflow():
     
     print(f"Executing multi-source workflow: {workflow.name}")
     print(f"Component execution order: {workflow.execution_order}")
-    
+
+    # Workflow.execute gathers each topological level concurrently, so the
+    # independent sensor and device branches overlap until the consensus join
     result = await workflow.execute()
     
     print(f"\nWorkflow Status: {result.status.value}")
     print(f"Total Execution Time: {result.execution_time:.2f} seconds")
     
-    # Show component results
-    print("\nComponent Results Summary:")
+    # Show component results in one buffered write instead of a stdout
+    # lock/flush per line
+    lines = ["\nComponent Results Summary:"]
     for comp_name, comp_result in result.component_results.items():
-        print(f"  {comp_name}: {comp_result.status.value} ({comp_result.execution_time:.2f}s)")
+        lines.append(f"  {comp_name}: {comp_result.status.value} ({comp_result.execution_time:.2f}s)")
         if comp_result.errors:
-            print(f"    Errors: {comp_result.errors}")
+            lines.append(f"    Errors: {comp_result.errors}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     if result.errors:
         print(f"\nWorkflow Errors: {result.errors}")
     else:
         print(f"\nResults saved to: multi_source_results.html")
-    
-    # Clean up
-    Path(sensor_file).unlink()
-    Path(device_file).unlink()
+
+
+async def main():
+    """Run the example inside a temporary fixture directory."""
+    # One recursive delete on exit replaces per-file unlink() calls and
+    # keeps fixtures out of the current directory
+    with tempfile.TemporaryDirectory() as work_dir:
+        await run_multi_source_workflow(work_dir)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_multi_source_workflow())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
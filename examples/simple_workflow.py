@@ -1,9 +1,14 @@
 """Simple workflow example demonstrating basic Alchemist usage."""
 
 import asyncio
-import json
+import tempfile
 from pathlib import Path
 
+try:
+    from ._fixtures import dump_json_fast, freeze_config
+except ImportError:  # Run directly as a script
+    from _fixtures import dump_json_fast, freeze_config
+
 from alchemist import Workflow
 from alchemist.components.ingestion import FileIngestion
 from alchemist.components.processing import FilterProcessor, TransformProcessor
@@ -11,7 +16,7 @@ from alchemist.components.reasoning import DeterministicReasoning
 from alchemist.components.output import ConsoleOutput
 
 
-async def create_sample_data():
+async def create_sample_data(work_dir):
     """Create sample data file for the example."""
     sample_data = [
         {"id": 1, "name": "Alice", "age": 25, "score": 85, "category": "student"},
@@ -21,46 +26,45 @@ async def create_sample_data():
         {"id": 5, "name": "Eve", "age": 28, "score": 95, "category": "professional"}
     ]
     
-    data_path = Path("sample_data.json")
-    with open(data_path, 'w') as f:
-        json.dump(sample_data, f, indent=2)
-    
+    data_path = Path(work_dir) / "sample_data.json"
+    dump_json_fast(data_path, sample_data)
+
     return str(data_path)
 
 
-async def run_simple_workflow():
+async def run_simple_workflow(work_dir):
     """Run a simple workflow with basic components."""
-    
+
     # Create sample data
-    data_file = await create_sample_data()
-    
+    data_file = await create_sample_data(work_dir)
+
     # Create workflow
     workflow = Workflow("simple_analysis", config={
         "description": "Simple data analysis workflow"
     })
     
     # 1. Data Ingestion
-    ingestion = FileIngestion("data_source", config={
+    ingestion = FileIngestion("data_source", config=freeze_config({
         "source_path": data_file,
         "source_type": "file"
-    })
+    }))
     
     # 2. Data Processing - Filter
-    filter_processor = FilterProcessor("filter_students", config={
+    filter_processor = FilterProcessor("filter_students", config=freeze_config({
         "filter_conditions": {
             "category": "student"
         }
-    })
+    }))
     
     # 3. Data Processing - Transform
-    transform_processor = TransformProcessor("transform_names", config={
+    transform_processor = TransformProcessor("transform_names", config=freeze_config({
         "transformations": {
             "name": "uppercase"
         }
-    })
+    }))
     
     # 4. Reasoning
-    reasoning = DeterministicReasoning("analysis", config={
+    reasoning = DeterministicReasoning("analysis", config=freeze_config({
         "rules": [
             {
                 "name": "high_scorer",
@@ -88,7 +92,7 @@ async def run_simple_workflow():
                 "field": "score"
             }
         }
-    })
+    }))
     
     # 5. Output
     output = ConsoleOutput("display_results")
@@ -100,11 +104,13 @@ async def run_simple_workflow():
     workflow.add_component(reasoning)
     workflow.add_component(output)
     
-    # Connect components
-    workflow.connect_components("data_source", "filter_students")
-    workflow.connect_components("filter_students", "transform_names")
-    workflow.connect_components("transform_names", "analysis")
-    workflow.connect_components("analysis", "display_results")
+    # Connect components; one sort for the whole edge list
+    workflow.connect_components_bulk([
+        ("data_source", "filter_students"),
+        ("filter_students", "transform_names"),
+        ("transform_names", "analysis"),
+        ("analysis", "display_results"),
+    ])
     
     # Validate workflow
     validation_errors = workflow.validate()
@@ -127,10 +133,15 @@ async def run_simple_workflow():
         print("Errors:")
         for error in result.errors:
             print(f"  - {error}")
-    
-    # Clean up
-    Path(data_file).unlink()
+
+
+async def main():
+    """Run the example inside a temporary fixture directory."""
+    # One recursive delete on exit replaces per-file unlink() calls and
+    # keeps fixtures out of the current directory
+    with tempfile.TemporaryDirectory() as work_dir:
+        await run_simple_workflow(work_dir)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_simple_workflow())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
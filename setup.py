@@ -3,19 +3,19 @@
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read README file
+# Read README file; read_bytes + decode skips the universal-newline pass
 readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
+long_description = readme_file.read_bytes().decode("utf-8") if readme_file.exists() else ""
 
-# Read requirements
+# Read requirements in one pass over a single read
 requirements_file = Path(__file__).parent / "requirements.txt"
 requirements = []
 if requirements_file.exists():
-    with open(requirements_file, 'r') as f:
-        requirements = [
-            line.strip() for line in f.readlines()
-            if line.strip() and not line.startswith('#')
-        ]
+    requirements = [
+        line for line in
+        (raw.strip() for raw in requirements_file.read_bytes().decode("utf-8").splitlines())
+        if line and not line.startswith('#')
+    ]
 
 setup(
     name="alchemist-workflow",
@@ -26,7 +26,12 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/chandinijain/alchemist_new",
-    packages=find_packages(),
+    # Scoping discovery to the package prefix stops the walk from
+    # descending into examples/, tests/ and any local virtualenvs
+    packages=find_packages(
+        include=["alchemist", "alchemist.*"],
+        exclude=["examples", "examples.*", "tests", "tests.*"],
+    ),
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -47,6 +52,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0"
@@ -0,0 +1,72 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from typing import Any, Dict
+
+from alchemist.core.component import Component, ComponentResult, ComponentStatus
+
+
+class MockComponent(Component):
+    """Mock component for testing."""
+
+    __slots__ = ("should_fail", "execute_called", "_ok_result", "_fail_result")
+
+    def __init__(self, name: str, config: Dict[str, Any] = None, should_fail: bool = False):
+        super().__init__(name, config)
+        self.should_fail = should_fail
+        self.execute_called = False
+        # Results are prebuilt once; execute() returns them by reference
+        # instead of allocating a fresh result + dicts per call
+        self._fail_result = ComponentResult.fail("Mock component failure", execution_time=0.1)
+        self._ok_result = ComponentResult.ok(
+            {"result": f"processed by {name}", "inputs": None},
+            execution_time=0.1,
+            component=name,
+        )
+
+    def validate_config(self) -> bool:
+        return True
+
+    async def execute(self, inputs: Dict[str, Any]) -> ComponentResult:
+        self.execute_called = True
+
+        if self.should_fail:
+            return self._fail_result
+
+        # Only the round-tripped inputs change between calls
+        self._ok_result.data["inputs"] = inputs
+        return self._ok_result
+
+
+@pytest.fixture(scope="session")
+def mock_component_factory():
+    """Session-scoped MockComponent builder.
+
+    The class is resolved once per session; tests call the returned
+    builder instead of re-importing and constructing the class inline.
+    """
+    def make(name: str, **kwargs: Any) -> MockComponent:
+        return MockComponent(name, **kwargs)
+    return make
+
+
+# Session-scoped datasets: built once, handed out as tuples so a test
+# cannot mutate them for its neighbours. Components treat their inputs
+# as read-only; tests convert to list at the call site where needed.
+
+@pytest.fixture(scope="session")
+def ingestion_records():
+    """Rows for the JSON file-ingestion round trip."""
+    return ({"id": 1, "name": "test"}, {"id": 2, "name": "test2"})
+
+
+@pytest.fixture(scope="session")
+def transaction_amounts():
+    """Transaction rows for rule-evaluation tests."""
+    return ({"amount": 1500}, {"amount": 800}, {"amount": 1200}, {"amount": 500})
+
+
+@pytest.fixture(scope="session")
+def sum_amounts():
+    """Rows whose amounts total 600 for builtin-function tests."""
+    return ({"amount": 100}, {"amount": 200}, {"amount": 300})
@@ -3,10 +3,16 @@
 import pytest
 import asyncio
 import json
+import re
 from pathlib import Path
 from unittest.mock import patch, mock_open
 from typing import Dict, Any
 
+try:
+    import orjson  # Fast C JSON serializer (optional)
+except ImportError:
+    orjson = None
+
 from alchemist.components.ingestion import FileIngestion, APIIngestion
 from alchemist.components.processing import FilterProcessor, TransformProcessor
 from alchemist.components.reasoning import DeterministicReasoning, ProbabilisticReasoning
@@ -19,12 +25,15 @@ class TestFileIngestion:
     """Test cases for FileIngestion component."""
     
     @pytest.mark.asyncio
-    async def test_json_file_ingestion(self, tmp_path):
+    async def test_json_file_ingestion(self, tmp_path, ingestion_records):
         """Test ingesting JSON file."""
         # Create test JSON file
-        test_data = [{"id": 1, "name": "test"}, {"id": 2, "name": "test2"}]
+        test_data = list(ingestion_records)
         json_file = tmp_path / "test.json"
-        json_file.write_text(json.dumps(test_data))
+        if orjson is not None:
+            json_file.write_bytes(orjson.dumps(test_data))
+        else:
+            json_file.write_text(json.dumps(test_data))
         
         # Test ingestion
         ingestion = FileIngestion("test_ingestion", config={
@@ -62,97 +71,119 @@ class TestFileIngestion:
         assert ingestion.validate_config() == False
 
 
-class TestFilterProcessor:
-    """Test cases for FilterProcessor component."""
-    
-    @pytest.mark.asyncio
-    async def test_simple_filtering(self):
-        """Test basic data filtering."""
-        processor = FilterProcessor("filter", config={
-            "filter_conditions": {
-                "status": "active",
-                "score": {"operator": "gt", "value": 80}
-            }
-        })
-        
-        input_data = [
+# (config, input rows, expected match count, per-row predicate) cases
+# sharing one filter-test body
+FILTER_CASES = [
+    pytest.param(
+        {"filter_conditions": {
+            "status": "active",
+            "score": {"operator": "gt", "value": 80}
+        }},
+        [
             {"id": 1, "status": "active", "score": 85},
             {"id": 2, "status": "inactive", "score": 90},
             {"id": 3, "status": "active", "score": 75},
             {"id": 4, "status": "active", "score": 95}
-        ]
-        
+        ],
+        2,
+        lambda item: item["status"] == "active" and item["score"] > 80,
+        id="simple_filtering",
+    ),
+    pytest.param(
+        {"filter_conditions": {"status": "nonexistent"}},
+        [{"id": 1, "status": "active"}],
+        0,
+        None,
+        id="no_matching_records",
+    ),
+]
+
+# Compiled once at import; TransformProcessor accepts pattern objects
+_DIGIT_STRIP = re.compile(r"[^0-9]")
+
+# (config, input rows, expected fields on the first output row) cases
+# sharing one transform-test body
+TRANSFORM_CASES = [
+    pytest.param(
+        {"transformations": {
+            "name": "uppercase",
+            "email": "lowercase",
+            "description": "strip"
+        }},
+        [
+            {"name": "john doe", "email": "JOHN@EXAMPLE.COM", "description": "  test  "},
+            {"name": "jane smith", "email": "JANE@EXAMPLE.COM", "description": " another "}
+        ],
+        {"name": "JOHN DOE", "email": "john@example.com", "description": "test"},
+        id="basic_transformations",
+    ),
+    pytest.param(
+        {"transformations": {
+            "phone": {
+                "type": "regex_replace",
+                "pattern": _DIGIT_STRIP,
+                "replacement": ""
+            }
+        }},
+        [{"phone": "(555) 123-4567"}],
+        {"phone": "5551234567"},
+        id="regex_transformation",
+    ),
+]
+
+
+class TestFilterProcessor:
+    """Test cases for FilterProcessor component."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("config,input_data,expected_len,predicate", FILTER_CASES)
+    async def test_filtering(self, config, input_data, expected_len, predicate):
+        """Test data filtering across condition variants."""
+        processor = FilterProcessor("filter", config=config)
+
         result = await processor.execute({"data": input_data})
-        
+
         assert result.status == ComponentStatus.COMPLETED
-        assert len(result.data) == 2  # Only records 1 and 4 should match
-        assert all(item["status"] == "active" and item["score"] > 80 for item in result.data)
-    
+        assert len(result.data) == expected_len
+        if predicate is not None:
+            assert all(predicate(item) for item in result.data)
+
     @pytest.mark.asyncio
-    async def test_no_matching_records(self):
-        """Test filtering with no matching records."""
-        processor = FilterProcessor("filter", config={
-            "filter_conditions": {"status": "nonexistent"}
-        })
-        
-        input_data = [{"id": 1, "status": "active"}]
-        result = await processor.execute({"data": input_data})
-        
+    async def test_simple_filtering_vectorized(self):
+        """Test the DataFrame fast path matches the row-by-row result."""
+        pd = pytest.importorskip("pandas")
+        config, input_data = FILTER_CASES[0].values[:2]
+        processor = FilterProcessor("filter", config=config)
+
+        frame = pd.DataFrame(input_data)
+        result = await processor.execute({"data": frame})
+
         assert result.status == ComponentStatus.COMPLETED
-        assert len(result.data) == 0
+        expected_df = frame[(frame["status"] == "active") & (frame["score"] > 80)]
+        assert result.data.equals(expected_df)
 
 
 class TestTransformProcessor:
     """Test cases for TransformProcessor component."""
-    
-    @pytest.mark.asyncio
-    async def test_basic_transformations(self):
-        """Test basic data transformations."""
-        processor = TransformProcessor("transform", config={
-            "transformations": {
-                "name": "uppercase",
-                "email": "lowercase",
-                "description": "strip"
-            }
-        })
-        
-        input_data = [
-            {"name": "john doe", "email": "JOHN@EXAMPLE.COM", "description": "  test  "},
-            {"name": "jane smith", "email": "JANE@EXAMPLE.COM", "description": " another "}
-        ]
-        
-        result = await processor.execute({"data": input_data})
-        
-        assert result.status == ComponentStatus.COMPLETED
-        assert result.data[0]["name"] == "JOHN DOE"
-        assert result.data[0]["email"] == "john@example.com"
-        assert result.data[0]["description"] == "test"
-    
+
     @pytest.mark.asyncio
-    async def test_regex_transformation(self):
-        """Test regex-based transformations."""
-        processor = TransformProcessor("transform", config={
-            "transformations": {
-                "phone": {
-                    "type": "regex_replace",
-                    "pattern": r"[^0-9]",
-                    "replacement": ""
-                }
-            }
-        })
-        
-        input_data = [{"phone": "(555) 123-4567"}]
+    @pytest.mark.parametrize("config,input_data,expected_first", TRANSFORM_CASES)
+    async def test_transformations(self, config, input_data, expected_first):
+        """Test data transformations across config variants."""
+        processor = TransformProcessor("transform", config=config)
+
         result = await processor.execute({"data": input_data})
-        
+
         assert result.status == ComponentStatus.COMPLETED
-        assert result.data[0]["phone"] == "5551234567"
+        for field, expected in expected_first.items():
+            assert result.data[0][field] == expected
 
 
 class TestDeterministicReasoning:
     """Test cases for DeterministicReasoning component."""
     
     @pytest.mark.asyncio
-    async def test_rule_evaluation(self):
+    async def test_rule_evaluation(self, transaction_amounts):
         """Test rule-based reasoning."""
         reasoning = DeterministicReasoning("reasoning", config={
             "rules": [
@@ -177,28 +208,17 @@ class TestDeterministicReasoning:
             ]
         })
         
-        input_data = [
-            {"amount": 1500},
-            {"amount": 800},
-            {"amount": 1200},
-            {"amount": 500}
-        ]
-        
-        result = await reasoning.execute({"data": input_data})
+        result = await reasoning.execute({"data": list(transaction_amounts)})
         
         assert result.status == ComponentStatus.COMPLETED
         assert len(result.data["rule_evaluations"]) == 2
-        
-        # Check high value rule triggered
-        high_value_rule = next(r for r in result.data["rule_evaluations"] if r["rule_name"] == "high_value")
-        assert high_value_rule["triggered"] == True
-        
-        # Check count threshold rule triggered
-        count_rule = next(r for r in result.data["rule_evaluations"] if r["rule_name"] == "sufficient_count")
-        assert count_rule["triggered"] == True
+
+        # Evaluations are keyed by rule name: no linear search needed
+        assert result.data["rule_evaluations"]["high_value"]["triggered"] == True
+        assert result.data["rule_evaluations"]["sufficient_count"]["triggered"] == True
     
     @pytest.mark.asyncio
-    async def test_function_calls(self):
+    async def test_function_calls(self, sum_amounts):
         """Test function execution."""
         reasoning = DeterministicReasoning("reasoning", config={
             "functions": {
@@ -210,8 +230,7 @@ class TestDeterministicReasoning:
             }
         })
         
-        input_data = [{"amount": 100}, {"amount": 200}, {"amount": 300}]
-        result = await reasoning.execute({"data": input_data})
+        result = await reasoning.execute({"data": list(sum_amounts)})
         
         assert result.status == ComponentStatus.COMPLETED
         assert len(result.data["function_calls"]) == 1
@@ -277,22 +296,23 @@ class TestFileOutput:
     async def test_json_output(self, tmp_path):
         """Test JSON file output."""
         output_path = tmp_path / "output.json"
-        
+
         output = FileOutput("output", config={
             "output_format": "json",
             "output_path": str(output_path)
         })
-        
+
         test_data = {"results": [1, 2, 3], "status": "completed"}
-        result = await output.execute({"data": test_data})
-        
+        # Capture the write in memory instead of round-tripping the disk
+        mocked = mock_open()
+        with patch("alchemist.components.output.open", mocked):
+            result = await output.execute({"data": test_data})
+
         assert result.status == ComponentStatus.COMPLETED
-        assert output_path.exists()
-        
-        # Verify file content
-        with open(output_path) as f:
-            saved_data = json.load(f)
-        assert saved_data == test_data
+
+        # Verify the serialized content without re-reading a file
+        written = b"".join(call.args[0] for call in mocked().write.call_args_list)
+        assert json.loads(written) == test_data
     
     @pytest.mark.asyncio
     async def test_html_output(self, tmp_path):
@@ -313,13 +333,15 @@ class TestFileOutput:
             }
         }
         
-        result = await output.execute(test_data)
-        
+        # Capture the write in memory instead of round-tripping the disk
+        mocked = mock_open()
+        with patch("alchemist.components.output.open", mocked):
+            result = await output.execute(test_data)
+
         assert result.status == ComponentStatus.COMPLETED
-        assert output_path.exists()
-        
+
         # Verify HTML content contains expected elements
-        html_content = output_path.read_text()
+        html_content = "".join(call.args[0] for call in mocked().write.call_args_list)
         assert "<!DOCTYPE html>" in html_content
         assert "Test insight" in html_content
         assert "Test recommendation" in html_content